@@ -3,8 +3,7 @@
 of GeoPandas
 """
 
-import warnings
-
+import importlib
 
 from .trajectory import Trajectory  # noqa F401
 from .trajectory_generalizer import (  # noqa F401
@@ -31,10 +30,24 @@ from .trajectory_stop_detector import TrajectoryStopDetector  # noqa F401
 from .point_clusterer import PointClusterer  # noqa F401
 from .tools._show_versions import show_versions  # noqa F401
 
-try:
-    from .trajectory_smoother import KalmanSmootherCV  # noqa F401
-except ImportError as e:
-    warnings.warn(e.msg, UserWarning)
+# Submodules with optional dependencies are only imported on first access
+_LAZY_IMPORTS = {
+    "KalmanSmootherCV": "movingpandas.trajectory_smoother",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 name = "movingpandas"
 __version__ = "0.20.0"
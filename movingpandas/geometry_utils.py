@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from math import atan2, cos, degrees, pi, radians, sin, sqrt
 
+import numpy as np
 import shapely
+from geopandas import GeoSeries
 from geopy import distance
 from geopy.distance import geodesic
 from packaging.version import Version
@@ -17,6 +20,9 @@ except TypeError:
 
 R_EARTH = 6371000  # radius of earth in meters
 C_EARTH = 2 * R_EARTH * pi  # circumference
+# upper bound for the relative difference between spherical and geodesic (WGS84)
+# distances, which is about 0.6 %
+SPHERICAL_REL_ERROR = 0.01
 
 
 def _is_point(input):
@@ -26,6 +32,15 @@ def _is_point(input):
         )
 
 
+def _translate_point(point, xoff, yoff):
+    """
+    Shift a Point by the given offsets, like shapely.affinity.translate but
+    without the generic affine transformation machinery.
+    """
+    coords = point.coords[0]
+    return Point((coords[0] + xoff, coords[1] + yoff) + coords[2:])
+
+
 @deprecated
 def measure_distance_spherical(point1, point2):
     """
@@ -47,6 +62,107 @@ def measure_distance_spherical(point1, point2):
     return dist
 
 
+def measure_distance_spherical_array(lon1, lat1, lon2, lat2):
+    """
+    Return spherical distances between arrays of lon/lat coordinates.
+
+    All inputs are broadcast against each other, e.g. to compute the distances
+    between consecutive points of a trajectory:
+
+    >>> measure_distance_spherical_array(lon[:-1], lat[:-1], lon[1:], lat[1:])
+
+    Parameters
+    ----------
+    lon1, lat1 : array-like
+        Longitudes and latitudes of the start locations in degrees
+    lon2, lat2 : array-like
+        Longitudes and latitudes of the end locations in degrees
+
+    Returns
+    -------
+    dist : numpy.ndarray
+        Spherical distances in meters
+    """
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    delta_lat = lat2 - lat1
+    delta_lon = np.radians(np.subtract(lon2, lon1))
+    a = (
+        np.sin(delta_lat / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin(delta_lon / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return R_EARTH * c
+
+
+@lru_cache(maxsize=None)
+def _get_numba_kernels():
+    """
+    Return the Numba-compiled kernels module or None if Numba is not installed.
+    """
+    try:
+        from movingpandas.tools import _numba_kernels
+    except ImportError:
+        return None
+    return _numba_kernels
+
+
+@lru_cache(maxsize=None)
+def _get_geod():
+    """
+    Return a pyproj WGS84 Geod or None if pyproj is not installed.
+    """
+    try:
+        from pyproj import Geod
+    except ImportError:
+        return None
+    return Geod(ellps="WGS84")
+
+
+def _haversine(lon1, lat1, lon2, lat2):
+    # same operations as the Numba kernel, each trig function evaluated once
+    lat1 = radians(lat1)
+    lat2 = radians(lat2)
+    sin_dlat = sin((lat2 - lat1) / 2)
+    sin_dlon = sin(radians(lon2 - lon1) / 2)
+    a = sin_dlat * sin_dlat + cos(lat1) * cos(lat2) * sin_dlon * sin_dlon
+    return R_EARTH * 2 * atan2(sqrt(a), sqrt(1 - a))
+
+
+def _get_spherical_distance_function():
+    """
+    Return a function (lon1, lat1, lon2, lat2) -> spherical distance in meters.
+
+    Uses the compiled Numba kernel if Numba is installed.
+    """
+    kernels = _get_numba_kernels()
+    if kernels is not None:
+        return kernels.haversine
+    return _haversine
+
+
+def _spherical_segment_lengths(lon, lat):
+    """
+    Return the spherical distances between consecutive lon/lat coordinates.
+
+    Uses the compiled Numba kernel if Numba is installed, NumPy otherwise.
+    """
+    lon = np.ascontiguousarray(lon, dtype=np.float64)
+    lat = np.ascontiguousarray(lat, dtype=np.float64)
+    if len(lon) < 2:
+        return np.zeros(0)
+    kernels = _get_numba_kernels()
+    if kernels is not None:
+        return kernels.haversine_segments(lon, lat)
+    # each vertex is shared by two segments, so convert it only once
+    lat = np.radians(lat)
+    cos_lat = np.cos(lat)
+    sin_dlat = np.sin(np.diff(lat) / 2)
+    sin_dlon = np.sin(np.radians(np.diff(lon)) / 2)
+    a = sin_dlat * sin_dlat + cos_lat[:-1] * cos_lat[1:] * sin_dlon * sin_dlon
+    return R_EARTH * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
 def measure_distance_euclidean(point1, point2):
     """
     Return euclidean distance between two shapely Points as float.
@@ -56,6 +172,30 @@ def measure_distance_euclidean(point1, point2):
     return point1.distance(point2)
 
 
+def measure_distance_euclidean_array(x1, y1, x2, y2):
+    """
+    Return euclidean distances between arrays of x/y coordinates.
+
+    The values are identical to measure_distance_euclidean for the same
+    pairs of 2D points.
+
+    Parameters
+    ----------
+    x1, y1 : array-like
+        Coordinates of the start locations
+    x2, y2 : array-like
+        Coordinates of the end locations
+
+    Returns
+    -------
+    dist : numpy.ndarray
+        Euclidean distances in CRS units
+    """
+    dx = np.subtract(x2, x1)
+    dy = np.subtract(y2, y1)
+    return np.sqrt(dx * dx + dy * dy)
+
+
 def measure_distance_geodesic(point1, point2):
     """
     This function calculates the geodesic distance between two points
@@ -75,16 +215,61 @@ def measure_distance_geodesic(point1, point2):
     """
     _is_point(point1)
     _is_point(point2)
-    lon1 = float(point1.x)
-    lon2 = float(point2.x)
-    lat1 = float(point1.y)
-    lat2 = float(point2.y)
+    return _geodesic_distance(point1.x, point1.y, point2.x, point2.y)
+
+
+def _geodesic_distance(lon1, lat1, lon2, lat2):
+    lon1 = float(lon1)
+    lon2 = float(lon2)
+    lat1 = float(lat1)
+    lat2 = float(lat2)
+    geod = _get_geod()
+    if geod is not None:
+        return geod.inv(lon1, lat1, lon2, lat2)[2]
     dist = distance.distance(
         (lat1, lon1), (lat2, lon2)
     ).meters  # uses geodesic dist and defaults to WGS84
     return dist
 
 
+def measure_distance_geodesic_array(lon1, lat1, lon2, lat2):
+    """
+    Return geodesic distances between arrays of lon/lat coordinates.
+
+    The values are identical to measure_distance_geodesic for the same
+    pairs of points.
+
+    Parameters
+    ----------
+    lon1, lat1 : array-like
+        Longitudes and latitudes of the start locations in degrees
+    lon2, lat2 : array-like
+        Longitudes and latitudes of the end locations in degrees
+
+    Returns
+    -------
+    dist : numpy.ndarray
+        Geodesic distances (on a WGS84 ellipsoid) in meters
+    """
+    lon1, lat1, lon2, lat2 = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (lon1, lat1, lon2, lat2))
+    )
+    geod = _get_geod()
+    if geod is not None:
+        if lon1.size == 1:
+            # pyproj treats single-element arrays as scalars
+            args = (lon1.item(), lat1.item(), lon2.item(), lat2.item())
+        else:
+            args = (lon1, lat1, lon2, lat2)
+        dist = geod.inv(*args)[2]
+        return np.reshape(np.asarray(dist, dtype=np.float64), lon1.shape)
+    dist = [
+        distance.distance((a, b), (c, d)).meters
+        for b, a, d, c in zip(lon1.flat, lat1.flat, lon2.flat, lat2.flat)
+    ]
+    return np.array(dist, dtype=np.float64).reshape(lon1.shape)
+
+
 def measure_distance(point1, point2, geodesic=False, conversion=None):
     """
     Convenience function that returns either euclidean or geodesic distance
@@ -99,6 +284,28 @@ def measure_distance(point1, point2, geodesic=False, conversion=None):
     return d
 
 
+def _measure_distance(point1, point2, geodesic=False):
+    """
+    measure_distance without the Point type checks, for internal callers that
+    iterate over the points of a trajectory
+    """
+    if geodesic:
+        return _geodesic_distance(point1.x, point1.y, point2.x, point2.y)
+    return point1.distance(point2)
+
+
+def _measure_distance_xy(x1, y1, x2, y2, geodesic=False):
+    """
+    _measure_distance for raw coordinates, without creating Points
+    """
+    if geodesic:
+        return _geodesic_distance(x1, y1, x2, y2)
+    # the same computation as GEOS uses for the distance between two points
+    dx = x2 - x1
+    dy = y2 - y1
+    return sqrt(dx * dx + dy * dy)
+
+
 def measure_distance_line(linestring, other, conversion):
     """
     Returns the euclidean distance between a linestring and other geometry
@@ -107,10 +314,32 @@ def measure_distance_line(linestring, other, conversion):
     return d / conversion.distance
 
 
+def _is_point_series(geoseries):
+    """
+    Return True if geoseries is a GeoSeries of at least two non-empty Points.
+    """
+    if not isinstance(geoseries, GeoSeries) or len(geoseries) < 2:
+        return False
+    return bool(((geoseries.geom_type == "Point") & ~geoseries.is_empty).all())
+
+
 def measure_length(geoseries, spherical=False, conversion=None):
     """
     Returns the total distance between the points of the geoseries
     """
+    if _is_point_series(geoseries):
+        x = geoseries.x.to_numpy(dtype=float)
+        y = geoseries.y.to_numpy(dtype=float)
+        if not spherical:
+            # sum the segment lengths in order, like GEOS does for
+            # LineString.length, without building the line from tuples first
+            d = measure_distance_euclidean_array(x[:-1], y[:-1], x[1:], y[1:])
+            return np.cumsum(d)[-1] / conversion.distance
+        geod = _get_geod()
+        if geod is not None:
+            # same WGS84 geodesic as geopy, but all segments in one compiled call
+            return geod.line_length(x, y) / conversion.distance
+
     pt_tuples = [(pt.y, pt.x) for pt in geoseries.tolist()]
     if spherical:
         length = geodesic(*pt_tuples).m
@@ -137,21 +366,50 @@ def calculate_initial_compass_bearing(point1, point2):
     """
     _is_point(point1)
     _is_point(point2)
-    lat1 = radians(point1.y)
-    lat2 = radians(point2.y)
-    delta_lon = radians(point2.x - point1.x)
-    x = sin(delta_lon) * cos(lat2)
-    y = cos(lat1) * sin(lat2) - (sin(lat1) * cos(lat2) * cos(delta_lon))
+    return _compass_bearing(point1.x, point1.y, point2.x, point2.y)
+
+
+def _compass_bearing(lon1, lat1, lon2, lat2):
+    lat1 = radians(lat1)
+    lat2 = radians(lat2)
+    delta_lon = radians(lon2 - lon1)
+    cos_lat2 = cos(lat2)
+    x = sin(delta_lon) * cos_lat2
+    y = cos(lat1) * sin(lat2) - (sin(lat1) * cos_lat2 * cos(delta_lon))
     initial_bearing = atan2(x, y)
     # Now we have the initial bearing but math.atan2 return values
     # from -180° to + 180° which is not what we want for a compass bearing
-    # The solution is to normalize the initial bearing as shown below
-    initial_bearing = degrees(initial_bearing)
-    compass_bearing = (initial_bearing + 360) % 360
+    # The solution is to normalize the negative bearings as shown below
+    # (the modulo keeps tiny negative values from rounding up to 360)
+    compass_bearing = degrees(initial_bearing)
+    if compass_bearing < 0:
+        compass_bearing = (compass_bearing + 360) % 360
 
     return compass_bearing
 
 
+def _compass_bearing_segments(lon, lat):
+    """
+    Return the compass bearings between consecutive lon/lat coordinates.
+
+    Uses the compiled Numba kernel if Numba is installed. Both versions give
+    the same values as calculate_initial_compass_bearing.
+    """
+    lon = np.ascontiguousarray(lon, dtype=np.float64)
+    lat = np.ascontiguousarray(lat, dtype=np.float64)
+    if len(lon) < 2:
+        return np.zeros(0)
+    kernels = _get_numba_kernels()
+    if kernels is not None:
+        return kernels.compass_bearing_segments(lon, lat)
+    lon = lon.tolist()
+    lat = lat.tolist()
+    return np.array(
+        [_compass_bearing(*args) for args in zip(lon[:-1], lat[:-1], lon[1:], lat[1:])],
+        dtype=np.float64,
+    )
+
+
 def azimuth(point1, point2):
     """
     Calculates euclidean bearing of line between two points.
@@ -165,14 +423,39 @@ def azimuth(point1, point2):
     return azimuth
 
 
+def azimuth_array(x, y):
+    """
+    Calculates euclidean bearings of the lines between consecutive points.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Coordinates of the points
+
+    Returns
+    -------
+    numpy.ndarray
+        Bearings in degrees [0, 360), one less than the number of points
+    """
+    angle = np.degrees(np.arctan2(np.diff(x), np.diff(y)))
+    angle[angle < 0] += 360
+    return angle
+
+
 def angular_difference(degrees1, degrees2):
     """
     Calculates the smaller angle between the provided bearings / headings.
     """
-    diff = abs(degrees1 - degrees2)
-    if diff > 180:
-        diff = abs(diff - 360)
-    return diff
+    diff = abs(degrees1 - degrees2) % 360
+    return 360 - diff if diff > 180 else diff
+
+
+def angular_difference_array(degrees1, degrees2):
+    """
+    Calculates the smaller angles between arrays of bearings / headings.
+    """
+    diff = np.abs(np.subtract(degrees1, degrees2)) % 360
+    return np.minimum(diff, 360 - diff)
 
 
 def mrr_diagonal(geom, spherical=False):
@@ -184,13 +467,19 @@ def mrr_diagonal(geom, spherical=False):
         return 0
     _geom = geom.geoms if SHAPELY_GE_2 else geom
     if len(_geom) == 2:
-        return measure_distance(_geom[0], _geom[1], spherical)
+        return _measure_distance(_geom[0], _geom[1], spherical)
     mrr = geom.minimum_rotated_rectangle
+    if SHAPELY_GE_2:
+        coords = shapely.get_coordinates(mrr).tolist()
+        # usually mrr is a Polygon, for collinear points it is a LineString
+        (x0, y0), (x1, y1) = coords[0], coords[2 if mrr.geom_type == "Polygon" else -1]
+        return _measure_distance_xy(x0, y0, x1, y1, spherical)
     try:  # usually mrr is a Polygon
         x, y = mrr.exterior.coords.xy
     except AttributeError:  # thrown if mrr is a LineString
-        return measure_distance(Point(mrr.coords[0]), Point(mrr.coords[-1]), spherical)
-    return measure_distance(Point(x[0], y[0]), Point(x[2], y[2]), spherical)
+        (x0, y0, *_), (x1, y1, *_) = mrr.coords[0], mrr.coords[-1]
+        return _measure_distance_xy(x0, y0, x1, y1, spherical)
+    return _measure_distance_xy(x[0], y[0], x[2], y[2], spherical)
 
 
 def point_gdf_to_linestring(df, geom_col_name):
@@ -198,6 +487,14 @@ def point_gdf_to_linestring(df, geom_col_name):
     Convert GeoDataFrame of Points to shapely LineString
     """
     if len(df) > 1:
+        geoms = df[geom_col_name].values
+        if SHAPELY_GE_2 and _is_point_series(df[geom_col_name]):
+            has_z = shapely.has_z(geoms)
+            if has_z.all() or not has_z.any():
+                # build the line from a coordinate array in one call instead
+                # of unwrapping the Points one by one
+                coords = shapely.get_coordinates(geoms, include_z=bool(has_z[0]))
+                return LineString(coords)
         return LineString(df[geom_col_name].tolist())
     else:
         raise RuntimeError("DataFrame needs at least two points to make line!")
@@ -1,14 +1,29 @@
 import json
 from typing import Callable, Dict
 
+import numpy as np
 from geopandas import GeoDataFrame
-from pandas import DataFrame
+from pandas import DataFrame, DatetimeIndex, factorize
 
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def _datetime_to_string(dt, format="%Y-%m-%d %H:%M:%S"):
+
+def _datetime_to_string(dt, format=_DATETIME_FORMAT):
     return dt.strftime(format)
 
 
+def _datetimes_to_strings(datetimes):
+    """
+    Apply _datetime_to_string to all datetimes, vectorized for DatetimeIndex.
+    """
+    if isinstance(datetimes, DatetimeIndex) and not datetimes.hasnans:
+        # the format only has wall time fields, so dropping the time zone does
+        # not change the strings but allows pandas' fast path for naive values
+        strings = datetimes.tz_localize(None).strftime(_DATETIME_FORMAT)
+        return strings.to_numpy(dtype=object)
+    return np.array([_datetime_to_string(dt) for dt in datetimes], dtype=object)
+
+
 def gdf_to_mf_json(
     gdf: GeoDataFrame,
     traj_id_column: str,
@@ -20,6 +35,7 @@ def gdf_to_mf_json(
     trs=None,
     datetime_encoder: Callable = None,
     datetime_to_str: bool = False,
+    coord_precision: int = None,
     # simplified typing hint due to https://github.com/movingpandas/movingpandas/issues/345  # noqa F401
 ) -> dict:
     """
@@ -44,6 +60,9 @@ def gdf_to_mf_json(
         datetime_encoder (Callable[[any], str|int], optional): A function that encodes
             the datetime values in the GeoDataFrame to a string ( IETF RFC 3339 ) or
             integer ( Timestamp, milliseconds ). Defaults to None.
+        coord_precision (int, optional): Number of decimals to round the
+            coordinates to, e.g. to shorten the encoded JSON. Defaults to None
+            (no rounding).
     Returns:
         dict: The MF-JSON representation of the GeoDataFrame as a dictionary.
     """
@@ -58,22 +77,36 @@ def gdf_to_mf_json(
     if datetime_to_str:
         datetime_encoder = _datetime_to_string
 
-    for identifier, row in gdf.groupby(traj_id_column):
-        datetimes = _retrieve_datetimes_from_row(datetime_column, datetime_encoder, row)
-
-        properties = row.drop(
-            columns=[
-                "geometry",
-                datetime_column,
-                traj_id_column,
-                *temporal_columns,
-            ]
-        )
+    # sort the rows by trajectory once and slice flat lists per trajectory,
+    # instead of creating a DataFrame for every group
+    identifiers, gdf, starts, ends = _sort_by_traj_id(gdf, traj_id_column)
+    xs = gdf.geometry.x.to_numpy()
+    ys = gdf.geometry.y.to_numpy()
+    if coord_precision is not None:
+        xs = np.round(xs, coord_precision)
+        ys = np.round(ys, coord_precision)
+    xs = xs.tolist()
+    ys = ys.tolist()
+    all_datetimes = _retrieve_datetimes_from_row(datetime_column, datetime_encoder, gdf)
+    temporal_values = {prop: gdf[prop].tolist() for prop in temporal_columns}
+    properties = gdf.drop(
+        columns=[
+            "geometry",
+            datetime_column,
+            traj_id_column,
+            *temporal_columns,
+        ]
+    )
+    if len(properties.columns) == 0:
+        all_encoded_properties = [{}] * len(starts)
+    else:
+        # static properties are taken from the first row of each trajectory
+        all_encoded_properties = properties.iloc[starts].to_dict(orient="records")
 
-        if properties.empty:
-            encoded_properties = {}
-        else:
-            encoded_properties = properties.to_dict(orient="records")[0]
+    for identifier, start, end, encoded_properties in zip(
+        identifiers, starts, ends, all_encoded_properties
+    ):
+        datetimes = all_datetimes[start:end]
 
         trajectory_data = {
             "type": "Feature",
@@ -83,7 +116,7 @@ def gdf_to_mf_json(
             },
             "temporalGeometry": {
                 "type": "MovingPoint",
-                "coordinates": list(zip(row.geometry.x, row.geometry.y)),
+                "coordinates": list(zip(xs[start:end], ys[start:end])),
                 "datetimes": datetimes,
             },
         }
@@ -99,7 +132,10 @@ def gdf_to_mf_json(
 
         if temporal_columns:
             temporal_properties_data = _encode_temporal_properties(
-                datetimes, row, temporal_columns, temporal_columns_static_fields
+                datetimes,
+                {prop: values[start:end] for prop, values in temporal_values.items()},
+                temporal_columns,
+                temporal_columns_static_fields,
             )
 
             trajectory_data["temporalProperties"] = [temporal_properties_data]
@@ -129,7 +165,27 @@ def _raise_error_if_invalid_arguments(
         )
 
 
+def _sort_by_traj_id(gdf, traj_id_column):
+    """
+    Return the trajectory ids in groupby order, gdf sorted by trajectory id and
+    the start and end positions of each trajectory in the sorted gdf.
+    """
+    codes, identifiers = factorize(gdf[traj_id_column], sort=True)
+    order = np.argsort(codes, kind="stable")
+    # rows with missing ids get code -1 and are dropped, as in groupby
+    order = order[codes[order] >= 0]
+    codes = codes[order]
+    if len(codes) == 0:
+        return identifiers, gdf.take(order), [], []
+    bounds = (np.flatnonzero(np.diff(codes)) + 1).tolist()
+    return identifiers, gdf.take(order), [0, *bounds], [*bounds, len(codes)]
+
+
 def _retrieve_datetimes_from_row(datetime_column, datetime_encoder, row):
+    if datetime_encoder is _datetime_to_string:
+        # timestamps often repeat, so format each distinct value only once
+        codes, uniques = factorize(row[datetime_column], use_na_sentinel=False)
+        return _datetimes_to_strings(uniques)[codes].tolist()
     datetimes = row[datetime_column].tolist()
     if datetime_encoder:
         datetimes = [datetime_encoder(dt) for dt in datetimes]
@@ -137,14 +193,14 @@ def _retrieve_datetimes_from_row(datetime_column, datetime_encoder, row):
 
 
 def _encode_temporal_properties(
-    datetimes, row, temporal_properties, temporal_properties_static_fields
+    datetimes, values, temporal_properties, temporal_properties_static_fields
 ):
     temporal_properties_data = {
         "datetimes": datetimes,
     }
     for prop in temporal_properties:
         temporal_properties_data[prop] = {
-            "values": row[prop].tolist(),
+            "values": values[prop],
         }
         if prop in (temporal_properties_static_fields or {}):
             temporal_properties_data[prop].update(
@@ -228,7 +284,7 @@ def _create_geometry_from_linestring(data):
     if data["geometry"]["type"] == "LineString":
         t = data["properties"]["datetimes"]
         x, y = map(list, zip(*data["geometry"]["coordinates"]))
-        return DataFrame(list(zip(t, x, y)), columns=["t", "x", "y"])
+        return DataFrame({"t": t, "x": x, "y": y})
     else:
         raise RuntimeError(
             f"Not a supported MovingFeatures JSON: "
@@ -251,8 +307,8 @@ def _add_properties(df, data):
             # The array of a time-varying attribute with step interpolation
             # has elements with one less than the number of positions of the
             # "datetimes" member;
-            values.append(values[-1])
-            df[property_name] = values
+            # (repeat the last value without modifying the input data)
+            df[property_name] = values + values[-1:]
         elif len(values) == 1:
             # The array of a fixed attribute during the whole of "datetimes"
             # has only one element.
@@ -275,24 +331,22 @@ def _create_traj_from_mfjson_trajectory(data, traj_id_property, traj_id):
 
 
 def _get_temporal_properties(data):
-    cols = []
-    props = []
+    columns = {}
     for key, values in data.items():
         if key == "datetimes":
-            cols.append("t")
-            props.append(values)
+            columns["t"] = values
         else:
-            cols.append(key)
-            props.append(values["values"])
-    transposed = [list(i) for i in zip(*props)]
-    return DataFrame(transposed, columns=cols)
+            columns[key] = values["values"]
+    # ignore values beyond the shortest list, as transposing with zip did
+    n = min((len(values) for values in columns.values()), default=0)
+    return DataFrame({key: values[:n] for key, values in columns.items()})
 
 
 def _create_geometry_from_movingpoint(data):
     if data["temporalGeometry"]["type"] == "MovingPoint":
         t = data["temporalGeometry"]["datetimes"]
         x, y = map(list, zip(*data["temporalGeometry"]["coordinates"]))
-        return DataFrame(list(zip(t, x, y)), columns=["t", "x", "y"])
+        return DataFrame({"t": t, "x": x, "y": y})
     else:
         raise RuntimeError(
             f"Not a supported MovingFeatures JSON: "
@@ -307,11 +361,11 @@ def _create_traj_from_mfjson_movingpoint(data, traj_id_property, traj_id):
     df = _create_geometry_from_movingpoint(data)
     if traj_id_property:
         traj_id = _get_id_property_value(data, traj_id_property)
-    if "temporalProperties" in data:
+    if data.get("temporalProperties"):
+        df = df.set_index("t")
         for property_group in data["temporalProperties"]:
-            df.set_index("t", inplace=True)
             df = df.join(_get_temporal_properties(property_group).set_index("t"))
-            df["t"] = df.index
+        df["t"] = df.index
     return Trajectory(df, traj_id, t="t", x="x", y="y", traj_id_col=traj_id_property)
 
 
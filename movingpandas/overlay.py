@@ -1,29 +1,35 @@
 # -*- coding: utf-8 -*-
 
 import itertools as it
+from copy import copy
+import numpy as np
 import pandas as pd
 from shapely.geometry import Point, LineString, shape
-from shapely.affinity import translate
 from datetime import datetime, timedelta
 
 from .spatiotemporal_utils import TRange, STRange
 
 
-def _get_spatiotemporal_ref(row):
+def _get_spatiotemporal_ref(intersection, line, prev_t, t):
     """
-    Returns the SpatioTemporalRange for the input row's spatial_intersection
-    LineString by interpolating timestamps.
+    Returns the SpatioTemporalRange for the spatial intersection LineString of
+    the segment line from prev_t to t by interpolating timestamps.
     """
-    if row["spatial_intersection"].is_empty:
+    if intersection.is_empty:
         return None
-    if type(row["spatial_intersection"]) == LineString:
-        pt0 = Point(row["spatial_intersection"].coords[0])
-        ptn = Point(row["spatial_intersection"].coords[-1])
-        t = row["prev_t"]
-        t_delta = row["t"] - t
-        length = row["line"].length
-        t0 = t + (t_delta * row["line"].project(pt0) / length)
-        tn = t + (t_delta * row["line"].project(ptn) / length)
+    if isinstance(intersection, LineString):
+        coords = intersection.coords
+        c0 = coords[0]
+        cn = coords[-1]
+        pt0 = Point(c0)
+        ptn = Point(cn)
+        # to avoid intersection issues with zero length lines
+        if cn == (c0[0] + 0.00000001, c0[1] + 0.00000001) + c0[2:]:
+            return STRange(pt0, ptn, prev_t, t)
+        t_delta = t - prev_t
+        length = line.length
+        t0 = prev_t + (t_delta * line.project(pt0) / length)
+        tn = prev_t + (t_delta * line.project(ptn) / length)
         # to avoid numerical issues with microseconds beyond six digits,
         # we reconstruct the timestamps
         t0 = datetime(
@@ -32,15 +38,11 @@ def _get_spatiotemporal_ref(row):
         tn = datetime(
             tn.year, tn.month, tn.day, tn.hour, tn.minute, tn.second, tn.microsecond
         )
-        # to avoid intersection issues with zero length lines
-        if ptn == translate(pt0, 0.00000001, 0.00000001):
-            t0 = row["prev_t"]
-            tn = row["t"]
         # to avoid numerical issues with timestamps
-        if is_equal(tn, row["t"]):
-            tn = row["t"]
-        if is_equal(t0, row["prev_t"]):
-            t0 = row["prev_t"]
+        if is_equal(tn, t):
+            tn = t
+        if is_equal(t0, prev_t):
+            t0 = prev_t
         return STRange(pt0, ptn, t0, tn)
     else:
         return None
@@ -72,18 +74,32 @@ def _dissolve_ranges(ranges):
     return dissolved_ranges
 
 
+_EQUAL_TIME_TOLERANCE = timedelta(milliseconds=10)
+
+
 def is_equal(t1, t2):
     """
     Similar timestamps are considered equal to avoid numerical issues.
     """
-    if type(t2) == pd.Timestamp:
+    if isinstance(t2, pd.Timestamp):
         td = abs(t1 - t2.tz_localize(t1.tzinfo).to_pydatetime())
     else:
         td = abs(t1 - t2)
-    return td < timedelta(milliseconds=10)
+    return td < _EQUAL_TIME_TOLERANCE
+
+
+def _bounds_disjoint(bounds, other_bounds):
+    minx, miny, maxx, maxy = bounds
+    other_minx, other_miny, other_maxx, other_maxy = other_bounds
+    return (
+        maxx < other_minx or other_maxx < minx or maxy < other_miny or other_maxy < miny
+    )
 
 
 def intersects(traj, polygon):
+    # cheap bounding box test before building the trajectory's LineString
+    if _bounds_disjoint(traj.get_bbox(), polygon.bounds):
+        return False
     try:
         line = traj.to_linestring()
     except:  # noqa: E722
@@ -96,36 +112,30 @@ def create_entry_and_exit_points(traj, range):
     Returns a dataframe with inserted entry and exit points according to the
     provided SpatioTemporalRange.
     """
-    if type(range) != STRange:
+    if not isinstance(range, STRange):
         raise TypeError("Input range has to be a SpatioTemporalRange!")
+    return _insert_points(traj.df, {range.t_0: range.pt_0, range.t_n: range.pt_n})
 
-    crs = traj.df.crs
-    temp_df = traj.df.copy()
-
-    index = traj.df.index
-    # Create row at entry point with attributes from previous row = pad
-    row0 = traj.df.iloc[index.get_indexer([range.t_0], method="pad")[0]].copy()
-    row0["geometry"] = range.pt_0
-    # Create row at exit point
-    rown = traj.df.iloc[index.get_indexer([range.t_n], method="pad")[0]].copy()
-    rown["geometry"] = range.pt_n
-    # Insert rows
-    try:
-        temp_df.loc[range.t_0] = row0
-    except ValueError as err:
-        if str(err) == "cannot set a single element with an array":
-            # fix for https://github.com/anitagraser/movingpandas/issues/118
-            # (not sure what causes this problem)
-            pass
-        else:
-            raise err
-    try:
-        temp_df.loc[range.t_n] = rown
-    except ValueError as err:
-        if str(err) == "cannot set a single element with an array":
-            pass
-        else:
-            raise err
+
+def _insert_points(df, points):
+    """
+    Returns a copy of df with the points of the {timestamp: Point} dict added.
+    Points that fall on existing timestamps replace the geometry of those rows,
+    the others are inserted as new rows.
+    """
+    crs = df.crs
+    temp_df = df.copy()
+    index = df.index
+    new_times = [t for t in points if t not in index]
+    if len(new_times) < len(points):
+        replaced = index.isin(points)
+        temp_df.loc[replaced, "geometry"] = [points[t] for t in index[replaced]]
+    if new_times:
+        # create rows with attributes from previous row = pad
+        new_rows = df.iloc[index.get_indexer(new_times, method="pad")].copy()
+        new_rows.index = pd.Index(new_times, name=index.name)
+        new_rows["geometry"] = [points[t] for t in new_times]
+        temp_df = pd.concat([temp_df, new_rows])
 
     # ensure CRS is set, fix for https://github.com/anitagraser/movingpandas/issues/291
     temp_df = temp_df.set_crs(crs, allow_override=True)
@@ -133,13 +143,41 @@ def create_entry_and_exit_points(traj, range):
     return temp_df.sort_index()
 
 
+def _are_disjoint(ranges):
+    """
+    Returns True if no two ranges overlap or touch in time.
+    """
+    try:
+        ranges = sorted(ranges, key=lambda r: r.t_0)
+        return all(r.t_n < next_r.t_0 for r, next_r in zip(ranges, ranges[1:]))
+    except TypeError:
+        # e.g. naive and tz-aware timestamps cannot be compared
+        return False
+
+
 def _get_segments_for_ranges(traj, ranges):
     counter = it.count()
     segments = []  # list of trajectories
+    batched_traj = None
+    st_ranges = [r for r in ranges if isinstance(r, STRange)]
+    if st_ranges and _are_disjoint(st_ranges):
+        # no range contains another range's entry or exit point, so the points
+        # of all ranges can be inserted at once; shallow copy: only the
+        # DataFrame is replaced
+        points = {}
+        for r in st_ranges:
+            points[r.t_0] = r.pt_0
+            points[r.t_n] = r.pt_n
+        batched_traj = copy(traj)
+        batched_traj.df = _insert_points(traj.df, points)
     for the_range in ranges:
-        temp_traj = traj.copy()
-        if type(the_range) == STRange:
-            temp_traj.df = create_entry_and_exit_points(traj, the_range)
+        temp_traj = traj
+        if isinstance(the_range, STRange):
+            if batched_traj is not None:
+                temp_traj = batched_traj
+            else:
+                temp_traj = copy(traj)
+                temp_traj.df = create_entry_and_exit_points(traj, the_range)
         try:
             segment = temp_traj.get_segment_between(the_range.t_0, the_range.t_n)
         except ValueError:
@@ -154,18 +192,13 @@ def _get_segments_for_ranges(traj, ranges):
 
 def _determine_time_ranges_pointbased(traj, polygon):
     df = traj.df
-    df["t"] = df.index
-    df["intersects"] = df.intersects(polygon)
-    df["segment"] = (df["intersects"].shift(1) != df["intersects"]).astype(int).cumsum()
-    df = df.groupby("segment", as_index=False).agg(
-        {"t": ["min", "max"], "intersects": ["min"]}
-    )
-    df.columns = df.columns.map("_".join)
-
-    ranges = []
-    for _, row in df[df["intersects_min"]].iterrows():
-        ranges.append(TRange(row["t_min"], row["t_max"]))
-    return ranges
+    intersects = df.intersects(polygon).to_numpy(dtype=np.int8)
+    # runs of intersecting points start where the flag rises and end before it
+    # falls again; the index is sorted, so these are the runs' min and max times
+    edges = np.diff(intersects, prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return [TRange(t_0, t_n) for t_0, t_n in zip(df.index[starts], df.index[ends])]
 
 
 def _get_potentially_intersecting_lines(traj, polygon):
@@ -209,10 +242,17 @@ def _determine_time_ranges_linebased(traj, polygon):
         possible_matches = possible_matches.reindex(spatial_intersection_exp.index)
         possible_matches["spatial_intersection"] = spatial_intersection_exp
 
-    possible_matches["spatiotemporal_intersection"] = possible_matches.apply(
-        _get_spatiotemporal_ref, axis=1
-    )
-    ranges = possible_matches["spatiotemporal_intersection"]
+    # iterate over the columns instead of using apply(axis=1), which would
+    # create a Series for every segment
+    ranges = [
+        _get_spatiotemporal_ref(*values)
+        for values in zip(
+            possible_matches["spatial_intersection"],
+            possible_matches["line"],
+            possible_matches["prev_t"],
+            possible_matches["t"],
+        )
+    ]
     return _dissolve_ranges(ranges)
 
 
@@ -233,7 +273,7 @@ def _get_geometry_and_properties_from_feature(feature):
     """
     Provides convenience access to geometry and properties of a Shapely feature.
     """
-    if type(feature) != dict:
+    if not isinstance(feature, dict):
         raise TypeError("Trajectories can only be intersected with a Shapely feature!")
     try:
         geometry = shape(feature["geometry"])
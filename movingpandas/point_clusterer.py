@@ -1,11 +1,13 @@
 import math
 import statistics
 
+import numpy as np
+import shapely
 from geopandas import GeoDataFrame
 from pandas import DataFrame
 from shapely.geometry import Point
 
-from movingpandas.geometry_utils import C_EARTH, measure_distance_euclidean
+from movingpandas.geometry_utils import C_EARTH, SHAPELY_GE_2, _measure_distance_xy
 
 
 class PointClusterer:
@@ -26,29 +28,52 @@ class PointClusterer:
         cell_size = max_distance
         if is_latlon:
             cell_size = cell_size / C_EARTH * 360
+        if SHAPELY_GE_2:
+            geoms = np.asarray(df["geometry"].values, dtype=object)
+            xs = shapely.get_x(geoms).tolist()
+            ys = shapely.get_y(geoms).tolist()
+        else:
+            xs = [pt.x for pt in points]
+            ys = [pt.y for pt in points]
         self.grid = _Grid(bbox, cell_size)
-        self.grid.insert_points(points)
-        self.grid.redistribute_points(points)
+        self.grid.insert_points(points, xs, ys)
+        self.grid.redistribute_points(points, xs, ys)
 
     def get_clusters(self):
         return self.grid.resulting_clusters
 
 
 class _PointCluster:
-    def __init__(self, pt):
+    def __init__(self, pt, x, y):
         self.points = [pt]
-        self.centroid = pt
-
-    def add_point(self, pt):
+        self._centroid = pt
+        # coordinates as floats, reading them from the Points is much slower
+        self.xs = [x]
+        self.ys = [y]
+        self.centroid_x = x
+        self.centroid_y = y
+
+    def add_point(self, pt, x, y):
         self.points.append(pt)
+        self.xs.append(x)
+        self.ys.append(y)
 
     def delete_points(self):
         self.points = []
+        self.xs = []
+        self.ys = []
+
+    @property
+    def centroid(self):
+        # created on demand, the centroid changes with every inserted point
+        if self._centroid is None:
+            self._centroid = Point(self.centroid_x, self.centroid_y)
+        return self._centroid
 
     def recompute_centroid(self):
-        x = statistics.fmean(pt.x for pt in self.points)
-        y = statistics.fmean(pt.y for pt in self.points)
-        self.centroid = Point(x, y)
+        self.centroid_x = statistics.fmean(self.xs)
+        self.centroid_y = statistics.fmean(self.ys)
+        self._centroid = None
 
 
 class _Grid:
@@ -66,19 +91,19 @@ class _Grid:
         self.cells = [[None] * self.n_rows for _ in range(self.n_cols)]
         self.resulting_clusters = []
 
-    def insert_points(self, points):
-        for pt in points:
-            c = self.get_closest_centroid(pt, self.cell_size)
+    def insert_points(self, points, xs, ys):
+        for pt, x, y in zip(points, xs, ys):
+            c = self.get_closest_centroid(x, y, self.cell_size)
             if not c:
-                g = _PointCluster(pt)
+                g = _PointCluster(pt, x, y)
                 self.resulting_clusters.append(g)
-                (i, j) = self.get_grid_position(g.centroid)
+                (i, j) = self.get_grid_position(x, y)
                 self.cells[i][j] = g
             else:
                 (i, j) = c
                 g = self.cells[i][j]
                 if g:
-                    g.add_point(pt)
+                    g.add_point(pt, x, y)
                     g.recompute_centroid()
                 else:
                     print(f"Error: no group in cell {i}, {j}")
@@ -90,32 +115,33 @@ class _Grid:
             if g.centroid.compare(centroid):
                 return g
 
-    def get_closest_centroid(self, pt, max_dist=100000000):
-        (i, j) = self.get_grid_position(pt)
+    def get_closest_centroid(self, x, y, max_dist=100000000):
+        (i, j) = self.get_grid_position(x, y)
         shortest_dist = self.cell_size * 100
         nearest_centroid = None
         for k in range(max(i - 1, 0), min(i + 2, self.n_cols)):
             for m in range(max(j - 1, 0), min(j + 2, self.n_rows)):
                 if not self.cells[k][m]:  # no centroid in this cell yet
                     continue
-                dist = measure_distance_euclidean(pt, self.cells[k][m].centroid)
+                g = self.cells[k][m]
+                dist = _measure_distance_xy(x, y, g.centroid_x, g.centroid_y)
                 if dist <= max_dist and dist < shortest_dist:
                     nearest_centroid = (k, m)
                     shortest_dist = dist
         return nearest_centroid
 
-    def get_grid_position(self, pt):
-        i = math.floor((pt.x - self.x_min) / self.cell_size)
-        j = math.floor((pt.y - self.y_min) / self.cell_size)
+    def get_grid_position(self, x, y):
+        i = math.floor((x - self.x_min) / self.cell_size)
+        j = math.floor((y - self.y_min) / self.cell_size)
         return i, j
 
-    def redistribute_points(self, points):
+    def redistribute_points(self, points, xs, ys):
         for g in self.resulting_clusters:
             g.delete_points()
-        for pt in points:
-            (i, j) = self.get_closest_centroid(pt, self.cell_size * 20)
+        for pt, x, y in zip(points, xs, ys):
+            (i, j) = self.get_closest_centroid(x, y, self.cell_size * 20)
             if i is not None and j is not None:
                 g = self.cells[i][j]
-                g.add_point(pt)
+                g.add_point(pt, x, y)
             else:
                 print(f"Discarding {pt}")
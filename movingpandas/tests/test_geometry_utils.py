@@ -1,17 +1,32 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
 from math import sqrt
-from shapely.geometry import MultiPoint, Point
+from shapely.affinity import translate
+from geopandas import GeoDataFrame, GeoSeries
+from shapely.geometry import LineString, MultiPoint, Point
+from movingpandas import geometry_utils
 from movingpandas.geometry_utils import (
     azimuth,
+    azimuth_array,
     calculate_initial_compass_bearing,
     angular_difference,
+    angular_difference_array,
     mrr_diagonal,
     measure_distance_geodesic,
+    measure_distance_geodesic_array,
     measure_distance_euclidean,
+    measure_distance_euclidean_array,
     measure_distance_spherical,
+    measure_distance_spherical_array,
+    measure_length,
+    point_gdf_to_linestring,
+    _compass_bearing_segments,
+    _spherical_segment_lengths,
+    _translate_point,
 )
+from movingpandas.unit_utils import UNITS, get_conversion
 
 
 class TestGeometryUtils:
@@ -27,6 +42,10 @@ class TestGeometryUtils:
     def test_compass_bearing_south(self):
         assert calculate_initial_compass_bearing(Point(0, 0), Point(0, -10)) == 180
 
+    def test_compass_bearing_tiny_negative_angle(self):
+        bearing = calculate_initial_compass_bearing(Point(0, 0), Point(-1e-300, 10))
+        assert bearing == 0
+
     def test_azimuth_east(self):
         assert azimuth(Point(0, 0), Point(1, 0)) == 90
         assert azimuth(Point(0, 0), Point(100, 0)) == 90
@@ -52,6 +71,19 @@ class TestGeometryUtils:
     def test_azimuth_northwest(self):
         assert azimuth(Point(100, 100), Point(99, 101)) == 315
 
+    def test_azimuth_array(self):
+        x = np.array([0, 1, 1, 0, 0, 0])
+        y = np.array([0, 1, 0, -1, -1, 0])
+        assert azimuth_array(x, y).tolist() == [45, 180, 225, 0, 0]
+
+    def test_azimuth_array_matches_azimuth(self):
+        x = np.array([100, 99, 80, 120])
+        y = np.array([100, 101, 50, 55])
+        expected = [
+            azimuth(Point(x[i], y[i]), Point(x[i + 1], y[i + 1])) for i in range(3)
+        ]
+        assert azimuth_array(x, y).tolist() == expected
+
     def test_anglular_difference_tohigher(self):
         assert angular_difference(1, 5) == 4
 
@@ -70,6 +102,15 @@ class TestGeometryUtils:
     def test_anglular_difference_twonegative(self):
         assert angular_difference(-200, -160) == 40
 
+    def test_anglular_difference_large_difference(self):
+        assert angular_difference(0, 600) == 120
+
+    def test_anglular_difference_array(self):
+        d1 = np.array([1, 355, 180, 45, -45, -200, 0])
+        d2 = np.array([5, 5, 0, 45, 45, -160, 600])
+        expected = [angular_difference(a, b) for a, b in zip(d1, d2)]
+        np.testing.assert_array_equal(angular_difference_array(d1, d2), expected)
+
     def test_mrr_diagonal(self):
         assert mrr_diagonal(
             MultiPoint([Point(0, 0), Point(0, 2), Point(2, 0), Point(2, 2)])
@@ -86,6 +127,40 @@ class TestGeometryUtils:
             Point(-74.00597, 40.71427), Point(-118.24368, 34.05223)
         ) == pytest.approx(3935735)
 
+    def test_spherical_distance_array(self):
+        lon = np.array([-74.00597, -118.24368, -118.24368])
+        lat = np.array([40.71427, 34.05223, 34.05223])
+        dist = measure_distance_spherical_array(lon[:-1], lat[:-1], lon[1:], lat[1:])
+        assert dist.shape == (2,)
+        assert dist[0] == pytest.approx(3935735)
+        assert dist[1] == 0
+
+    def test_spherical_segment_lengths(self):
+        lon = np.array([-74.00597, -118.24368, -118.24368, 2.35])
+        lat = np.array([40.71427, 34.05223, 34.05223, 48.86])
+        expected = measure_distance_spherical_array(
+            lon[:-1], lat[:-1], lon[1:], lat[1:]
+        )
+        assert _spherical_segment_lengths(lon, lat) == pytest.approx(expected)
+
+    def test_spherical_segment_lengths_without_numba(self, monkeypatch):
+        lon = np.array([-74.00597, -118.24368, -118.24368, 2.35])
+        lat = np.array([40.71427, 34.05223, 34.05223, 48.86])
+        expected = _spherical_segment_lengths(lon, lat)
+        monkeypatch.setattr(geometry_utils, "_get_numba_kernels", lambda: None)
+        assert _spherical_segment_lengths(lon, lat) == pytest.approx(expected)
+
+    def test_spherical_distance_function(self, monkeypatch):
+        args = (-74.00597, 40.71427, -118.24368, 34.05223)
+        dist = geometry_utils._get_spherical_distance_function()(*args)
+        assert dist == pytest.approx(3935735)
+        monkeypatch.setattr(geometry_utils, "_get_numba_kernels", lambda: None)
+        dist = geometry_utils._get_spherical_distance_function()(*args)
+        assert dist == pytest.approx(3935735)
+
+    def test_spherical_segment_lengths_single_point(self):
+        assert len(_spherical_segment_lengths([1.0], [2.0])) == 0
+
     def test_geodesic_distance(self):
         # Distance between NYC, NY USA and Los Angeles, CA USA is
         # 3944411.0951634306 meters
@@ -126,3 +201,83 @@ class TestGeometryUtils:
             ),
             spherical=True,
         ) == pytest.approx(3944411)
+
+    def test_translate_point(self):
+        for pt in [Point(1.5, -2.25), Point(1.5, -2.25, 7)]:
+            result = _translate_point(pt, 0.00000001, 0.00000001)
+            assert result == translate(pt, 0.00000001, 0.00000001)
+            assert result.has_z == pt.has_z
+
+    def test_measure_distance_euclidean_array(self):
+        rng = np.random.default_rng(0)
+        x1, y1, x2, y2 = rng.random((4, 50)) * 1000
+        expected = [
+            measure_distance_euclidean(Point(a, b), Point(c, d))
+            for a, b, c, d in zip(x1, y1, x2, y2)
+        ]
+        result = measure_distance_euclidean_array(x1, y1, x2, y2)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_measure_length_matches_linestring_length(self):
+        rng = np.random.default_rng(0)
+        coords = np.cumsum(rng.random((200, 2)) * 1000, axis=0)
+        geoseries = GeoSeries([Point(xy) for xy in coords])
+        expected = LineString(coords).length
+        assert (
+            measure_length(geoseries, conversion=get_conversion(UNITS(), None))
+            == expected
+        )
+
+    def test_measure_length_geodesic(self, monkeypatch):
+        geoseries = GeoSeries(
+            [
+                Point(-74.00597, 40.71427),
+                Point(-118.24368, 34.05223),
+                Point(2.35, 48.86),
+            ]
+        )
+        conversion = get_conversion(UNITS(), None)
+        expected = measure_distance_geodesic(
+            geoseries[0], geoseries[1]
+        ) + measure_distance_geodesic(geoseries[1], geoseries[2])
+        assert measure_length(geoseries, True, conversion) == pytest.approx(expected)
+        monkeypatch.setattr(geometry_utils, "_get_geod", lambda: None)
+        assert measure_length(geoseries, True, conversion) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("with_pyproj", [True, False])
+    def test_measure_distance_geodesic_array(self, monkeypatch, with_pyproj):
+        if not with_pyproj:
+            monkeypatch.setattr(geometry_utils, "_get_geod", lambda: None)
+        lon = np.array([-74.00597, -118.24368, -118.24368, 2.35])
+        lat = np.array([40.71427, 34.05223, 34.05223, 48.86])
+        expected = [
+            measure_distance_geodesic(Point(a, b), Point(c, d))
+            for a, b, c, d in zip(lon[:-1], lat[:-1], lon[1:], lat[1:])
+        ]
+        result = measure_distance_geodesic_array(lon[:-1], lat[:-1], lon[1:], lat[1:])
+        np.testing.assert_array_equal(result, expected)
+        result = measure_distance_geodesic_array(lon[:1], lat[:1], lon[1:2], lat[1:2])
+        np.testing.assert_array_equal(result, expected[:1])
+
+    @pytest.mark.parametrize("with_numba", [True, False])
+    def test_compass_bearing_segments(self, monkeypatch, with_numba):
+        if not with_numba:
+            monkeypatch.setattr(geometry_utils, "_get_numba_kernels", lambda: None)
+        lon = np.array([-74.00597, -118.24368, -118.24368, 2.35, 2.35])
+        lat = np.array([40.71427, 34.05223, 34.05223, 48.86, 50.0])
+        expected = [
+            calculate_initial_compass_bearing(Point(a, b), Point(c, d))
+            for a, b, c, d in zip(lon[:-1], lat[:-1], lon[1:], lat[1:])
+        ]
+        result = _compass_bearing_segments(lon, lat)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_point_gdf_to_linestring(self):
+        df = GeoDataFrame(geometry=[Point(0, 0), Point(1, 2), Point(3, 1)])
+        line = point_gdf_to_linestring(df, "geometry")
+        assert line.wkt == "LINESTRING (0 0, 1 2, 3 1)"
+
+    def test_point_gdf_to_linestring_with_z(self):
+        df = GeoDataFrame(geometry=[Point(0, 0, 5), Point(1, 2, 6)])
+        line = point_gdf_to_linestring(df, "geometry")
+        assert line.wkt == "LINESTRING Z (0 0 5, 1 2 6)"
@@ -4,6 +4,8 @@ import os
 
 import pandas as pd
 import pytest
+from geopandas import GeoDataFrame
+from shapely.geometry import Point
 
 from movingpandas.io import (
     _create_objects_from_mf_json_dict,
@@ -66,6 +68,26 @@ class TestIO:
 
         assert traj.id == 5
 
+    def test_read_mf_dict_step_property(self):
+        feature = {
+            "type": "Feature",
+            "properties": {
+                "datetimes": [
+                    "2018-12-31T06:00:00Z",
+                    "2018-12-31T12:00:00Z",
+                    "2018-12-31T18:00:00Z",
+                ],
+                "wind": [0.0, 35.0],
+            },
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[111.9, 7.6], [111.3, 7.3], [111.1, 7.0]],
+            },
+        }
+        traj = read_mf_dict(feature)
+        assert list(traj.df["wind"]) == [0.0, 35.0, 35.0]
+        assert feature["properties"]["wind"] == [0.0, 35.0]
+
     def test_mf_collection_file(self):
         trajs_collection = read_mf_json(
             os.path.join(self.test_dir, "movingfeatures_collection.json"), "id"
@@ -178,6 +200,74 @@ class TestIO:
         # Compare the expected and actual Moving-Features JSON dictionaries.
         assert entity_mf_json == expected_mf_json
 
+    def test_gdf_to_mf_json_multiple_trajectories(self):
+        gdf = GeoDataFrame(
+            {
+                "id": ["b", "a", "b", "a", "b"],
+                "t": pd.to_datetime(
+                    [
+                        "2020-01-01 00:00:00",
+                        "2020-01-01 00:00:01",
+                        "2020-01-01 00:00:02",
+                        "2020-01-01 00:00:03",
+                        "2020-01-01 00:00:04",
+                    ]
+                ),
+                "name": ["B", "A", "B", "A", "B"],
+                "v": [1, 2, 3, 4, 5],
+            },
+            geometry=[Point(0, 0), Point(1, 1), Point(2, 2), Point(3, 3), Point(4, 4)],
+        )
+        features = gdf_to_mf_json(
+            gdf, "id", "t", temporal_columns=["v"], datetime_to_str=True
+        )["features"]
+        assert [f["properties"] for f in features] == [
+            {"id": "a", "name": "A"},
+            {"id": "b", "name": "B"},
+        ]
+        assert features[0]["temporalGeometry"]["coordinates"] == [(1, 1), (3, 3)]
+        assert features[1]["temporalGeometry"]["datetimes"] == [
+            "2020-01-01 00:00:00",
+            "2020-01-01 00:00:02",
+            "2020-01-01 00:00:04",
+        ]
+        assert features[1]["temporalProperties"][0]["v"] == {"values": [1, 3, 5]}
+
+    def test_gdf_to_mf_json_datetime_to_str_with_time_zone(self):
+        gdf = GeoDataFrame(
+            {
+                "id": [1, 1, 1],
+                "t": pd.to_datetime(
+                    [
+                        "2020-03-29 01:59:59",
+                        "2020-03-29 03:00:00",
+                        "2020-03-29 03:00:00",
+                    ]
+                ).tz_localize("Europe/Vienna"),
+            },
+            geometry=[Point(0, 0), Point(1, 1), Point(2, 2)],
+        )
+        features = gdf_to_mf_json(gdf, "id", "t", datetime_to_str=True)["features"]
+        assert features[0]["temporalGeometry"]["datetimes"] == [
+            "2020-03-29 01:59:59",
+            "2020-03-29 03:00:00",
+            "2020-03-29 03:00:00",
+        ]
+
+    def test_gdf_to_mf_json_coord_precision(self):
+        gdf = GeoDataFrame(
+            {
+                "id": [1, 1],
+                "t": pd.to_datetime(["2020-01-01 00:00:00", "2020-01-01 00:00:01"]),
+            },
+            geometry=[Point(16.123456789, 48.987654321), Point(16.5, 48.5)],
+        )
+        features = gdf_to_mf_json(gdf, "id", "t", coord_precision=5)["features"]
+        assert features[0]["temporalGeometry"]["coordinates"] == [
+            (16.12346, 48.98765),
+            (16.5, 48.5),
+        ]
+
     def test_not_geodataframe_raises_error(self):
         with pytest.raises(TypeError):
             gdf_to_mf_json(
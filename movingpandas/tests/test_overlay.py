@@ -1,11 +1,34 @@
 # -*- coding: utf-8 -*-
 
-from pytest import approx
+import pandas as pd
+from pytest import approx, raises
 from pandas.testing import assert_frame_equal
-from shapely.geometry import Polygon
+from shapely.geometry import Point, Polygon
 from datetime import datetime, timedelta
 from movingpandas.tests.test_trajectory import Node, make_traj, CRS_METRIC, CRS_LATLON
-from movingpandas.overlay import _get_potentially_intersecting_lines
+from movingpandas.overlay import (
+    _determine_time_ranges_linebased,
+    _get_potentially_intersecting_lines,
+    _get_segments_for_ranges,
+    create_entry_and_exit_points,
+)
+from movingpandas.spatiotemporal_utils import STRange
+
+
+def get_segments_per_range(traj, ranges):
+    segments = []
+    for r in ranges:
+        temp_traj = traj.copy()
+        temp_traj.df = create_entry_and_exit_points(traj, r)
+        segments.append(temp_traj.get_segment_between(r.t_0, r.t_n))
+    return segments
+
+
+def get_locations(segments):
+    return [
+        [(t, geom.wkt) for t, geom in segment.df.geometry.items()]
+        for segment in segments
+    ]
 
 
 class TestOverlay:
@@ -65,6 +88,47 @@ class TestOverlay:
             [Node(7, 10, second=23), Node(5, 10, second=25)], id="1_1", parent=traj
         )
 
+    def test_segments_for_ranges_match_per_range_segments(self):
+        polygon = Polygon([(5, -5), (7, -5), (7, 12), (5, 12), (5, -5)])
+        traj = self.default_traj_metric_5
+        ranges = _determine_time_ranges_linebased(traj, polygon)
+        assert len(ranges) == 2
+        result = _get_segments_for_ranges(traj, ranges)
+        expected = get_segments_per_range(traj, ranges)
+        assert get_locations(result) == get_locations(expected)
+
+    def test_segments_for_overlapping_and_touching_ranges(self):
+        traj = self.default_traj_metric_5
+        ranges = [
+            STRange(
+                Point(1, 0),
+                Point(8, 0),
+                datetime(1970, 1, 1, 0, 0, 1),
+                datetime(1970, 1, 1, 0, 0, 8),
+            ),
+            STRange(
+                Point(4, 0),
+                Point(10, 5),
+                datetime(1970, 1, 1, 0, 0, 4),
+                datetime(1970, 1, 1, 0, 0, 15),
+            ),
+            STRange(
+                Point(10, 5),
+                Point(5, 10),
+                datetime(1970, 1, 1, 0, 0, 15),
+                datetime(1970, 1, 1, 0, 0, 25),
+            ),
+        ]
+        result = _get_segments_for_ranges(traj, ranges)
+        expected = get_segments_per_range(traj, ranges)
+        assert len(result) == 3
+        assert get_locations(result) == get_locations(expected)
+        assert get_locations(result)[0] == [
+            (datetime(1970, 1, 1, 0, 0, 1), "POINT (1 0)"),
+            (datetime(1970, 1, 1, 0, 0, 6), "POINT (6 0)"),
+            (datetime(1970, 1, 1, 0, 0, 8), "POINT (8 0)"),
+        ]
+
     def test_clip_with_duplicate_traj_points_does_not_drop_any_points(self):
         polygon = Polygon([(5, -5), (7, -5), (7, 5), (5, 5), (5, -5)])
         traj = make_traj(
@@ -127,6 +191,13 @@ class TestOverlay:
         intersections = traj.clip(polygon, point_based=True)
         assert len(intersections) == 0
 
+    def test_clip_pointbased_does_not_alter_df(self):
+        polygon = Polygon([(5.1, -5), (7.5, -5), (7.5, 12), (5.1, 12), (5.1, -5)])
+        traj = make_traj([Node(), Node(6, 0, minute=6), Node(10, 0, minute=10)])
+        columns = traj.df.columns.tolist()
+        traj.clip(polygon, point_based=True)
+        assert traj.df.columns.tolist() == columns
+
     def test_clip_interpolated_singlepoint(self):
         polygon = Polygon([(5.1, -5), (6.4, -5), (6.4, 12), (5.1, 12), (5.1, -5)])
         traj = make_traj(
@@ -233,6 +304,16 @@ class TestOverlay:
         assert intersection.df.iloc[0]["intersecting_id"] == 1
         assert intersection.df.iloc[0]["intersecting_name"] == "foo"
 
+    def test_intersection_with_non_dict_feature_raises(self):
+        feature = pd.Series(
+            {
+                "geometry": Polygon([(5, -5), (7, -5), (8, 5), (5, 5), (5, -5)]),
+                "properties": {"id": 1},
+            }
+        )
+        with raises(TypeError):
+            self.default_traj_metric_5.intersection(feature)
+
     def test_clip_with_empty_spatial_intersection_linestrings(self):
         polygon = Polygon(
             [
@@ -271,3 +352,11 @@ class TestOverlay:
         assert len(coords) == len(expected)
         for o, e in zip(coords, expected):
             assert o == approx(e, 0.1)
+
+    def test_intersects_disjoint_bounds(self):
+        polygon = Polygon([(20, 20), (30, 20), (30, 30), (20, 30), (20, 20)])
+        assert not self.default_traj_metric_5.intersects(polygon)
+
+    def test_intersects_touching_bounds(self):
+        polygon = Polygon([(10, 5), (15, 5), (15, 8), (10, 8), (10, 5)])
+        assert self.default_traj_metric_5.intersects(polygon)
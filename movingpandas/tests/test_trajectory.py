@@ -16,6 +16,7 @@ from movingpandas.trajectory import (
     DISTANCE_COL_NAME,
     TIMEDELTA_COL_NAME,
     TRAJ_ID_COL_NAME,
+    _get_sorted_index_position,
 )
 from movingpandas.unit_utils import MissingCRSWarning
 
@@ -127,6 +128,11 @@ class TestTrajectory:
             "Length: 1.0m\nBounds: (0.0, 0.0, 0.0, 1.0)\nLINESTRING (0 0, 0 1)"
         )
 
+    def test_duplicate_timestamps_keep_first(self):
+        traj = make_traj([Node(0, 0), Node(5, 5), Node(10, 10, day=2)], CRS_METRIC)
+        assert traj.size() == 2
+        assert traj.to_linestring().wkt == "LINESTRING (0 0, 10 10)"
+
     def test_size(self):
         assert self.default_traj_metric.size() == 3
         assert self.default_traj_metric_5.size() == 5
@@ -193,6 +199,21 @@ class TestTrajectory:
         )
         assert pos == Point(6 + 4 / 10 * 5, 0)
 
+    def test_get_position_interpolated_before_start(self):
+        pos = self.default_traj_metric.interpolate_position_at(
+            datetime(1969, 12, 31, 23, 59, 59)
+        )
+        assert pos == Point(0, 0)
+
+    def test_get_sorted_index_position_matches_get_indexer(self):
+        index = self.default_traj_metric_5.df.index
+        times = [datetime(1970, 1, 1, 0, 0, s) for s in [5, 9, 14, 15, 16, 39, 40]]
+        times += [datetime(1969, 12, 31, 23, 0, 0), datetime(1970, 1, 1, 1, 0, 0)]
+        for method in ["ffill", "bfill", "nearest"]:
+            for t in times:
+                expected = index.get_indexer([t], method=method)[0]
+                assert _get_sorted_index_position(index, t, method) == expected
+
     def test_get_segment_between_existing_timestamps(self):
         segment = self.default_traj_metric_5.get_segment_between(
             datetime(1970, 1, 1, 0, 0, 10), datetime(1970, 1, 1, 0, 0, 30)
@@ -301,6 +322,16 @@ class TestTrajectory:
         traj.add_direction()
         assert traj.df[DIRECTION_COL_NAME].tolist() == [90.0, 90.0, 180.0, 270]
 
+    def test_add_direction_with_non_point_geometry_raises(self):
+        df = GeoDataFrame(
+            {"geometry": [Point(0, 0), LineString([(1, 1), (2, 2)]), Point(2, 3)]},
+            index=pd.date_range("2023-01-01", periods=3, freq="s"),
+            crs=CRS_METRIC,
+        )
+        traj = Trajectory(df, 1)
+        with pytest.raises(TypeError):
+            traj.add_direction()
+
     def test_add_direction_with_name(self):
         traj = make_traj(
             [Node(0, 0), Node(6, 0, day=2), Node(6, -6, day=3), Node(-6, -6, day=4)]
@@ -403,6 +434,11 @@ class TestTrajectory:
         traj.add_speed()
         assert traj.df[SPEED_COL_NAME].tolist() == [6.0, 6.0]
 
+    def test_add_speed_with_repeated_point(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=2), Node(6, 0, second=3)])
+        traj.add_speed(units=("m", "min"))
+        assert traj.df[SPEED_COL_NAME].tolist() == [180.0, 180.0, 0.0]
+
     def test_add_speed_with_units(self):
         traj = make_traj([Node(0, 0), Node(6, 0, second=1)])
         traj.add_speed(units=("km", "h"))
@@ -496,6 +532,24 @@ class TestTrajectory:
         traj.add_speed()
         assert len(traj.df) == 10
 
+    def test_add_speed_with_submicrosecond_timedelta(self):
+        import warnings
+
+        t0 = pd.Timestamp("2023-01-01 00:00:00")
+        t1 = t0 + pd.Timedelta(seconds=1)
+        df = pd.DataFrame(
+            {
+                "t": [t0, t1, t1 + pd.Timedelta(nanoseconds=500)],
+                "x": [0, 6, 7],
+                "y": [0, 0, 0],
+            }
+        )
+        traj = Trajectory(df, traj_id=1, t="t", x="x", y="y", crs=CRS_METRIC)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            traj.add_speed()
+        assert traj.df[SPEED_COL_NAME].tolist() == [6.0, 6.0, 0.0]
+
     def test_add_acceleration(self):
         traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(18, 0, second=2)])
         traj.add_acceleration()
@@ -610,6 +664,18 @@ class TestTrajectory:
         traj.add_distance()
         assert traj.df[DISTANCE_COL_NAME].tolist() == [0, 6.0]
 
+    def test_add_distance_with_repeated_points(self):
+        traj = make_traj(
+            [
+                Node(0, 0),
+                Node(3, 4, second=1),
+                Node(3, 4, second=2),
+                Node(0, 0, second=3),
+            ]
+        )
+        traj.add_distance(units="km")
+        assert traj.df[DISTANCE_COL_NAME].tolist() == [0, 0.005, 0, 0.005]
+
     def test_add_distance_with_units(self):
         traj = make_traj([Node(0, 0), Node(6, 0, second=1)])
         traj.add_distance(units="chain")
@@ -1011,6 +1077,12 @@ class TestTrajectory:
 
         assert_frame_equal(line_gdf, expected_line_gdf)
 
+    def test_to_line_gdf_with_repeated_point(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(6, 0, second=2)])
+        lines = traj.to_line_gdf().geometry.tolist()
+        assert lines[0] == LineString([(0, 0), (6, 0)])
+        assert lines[1] == LineString([(6, 0), (6.00000001, 0.00000001)])
+
     def test_to_traj_gdf(self):
         df = pd.DataFrame(
             [
@@ -8,9 +8,11 @@ from pyproj import CRS
 from datetime import datetime, timedelta
 from movingpandas.trajectory import Trajectory
 from movingpandas.trajectory_collection import TrajectoryCollection
+from movingpandas import trajectory_aggregator
 from movingpandas.trajectory_aggregator import (
     TrajectoryCollectionAggregator,
     _PtsExtractor,
+    _SequenceGenerator,
 )
 
 CRS_METRIC = CRS.from_user_input(31256)
@@ -221,3 +223,17 @@ class TestTrajectoryCollectionAggregator:
     def test_get_clusters_gdf_crs_latlon(self):
         self.create_latlon()
         assert self.trajectory_aggregator_latlon.get_clusters_gdf().crs == CRS_LATLON
+
+
+class TestSequenceGenerator:
+    def test_get_nearest_matches_nearest_points(self, monkeypatch):
+        cells = GeoDataFrame(
+            geometry=[Point(2, 0), Point(0, 0), Point(5, 5), Point(0, 2)],
+            index=[10, 11, 12, 13],
+        )
+        generator = _SequenceGenerator(cells, [])
+        pts = [Point(0.1, 0), Point(4, 4), Point(1, 0), Point(1, 1), Point(9, 9)]
+        result = [generator.get_nearest(pt) for pt in pts]
+        monkeypatch.setattr(trajectory_aggregator, "SHAPELY_GE_2", False)
+        assert result == [generator.get_nearest(pt) for pt in pts]
+        assert result[:2] == [11, 12]
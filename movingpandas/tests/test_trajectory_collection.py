@@ -85,6 +85,27 @@ class TestTrajectoryCollection:
         )
         assert len(collection) == 0
 
+    def test_trajectories_from_unsorted_df_with_missing_ids(self):
+        df = pd.DataFrame(
+            [
+                ["b", 0, 0, datetime(2018, 1, 1, 12, 0, 0)],
+                ["a", 5, 0, datetime(2018, 1, 1, 12, 0, 0)],
+                [None, 9, 9, datetime(2018, 1, 1, 12, 3, 0)],
+                ["b", 1, 0, datetime(2018, 1, 1, 12, 6, 0)],
+                ["a", 5, 3, datetime(2018, 1, 1, 12, 6, 0)],
+                ["b", 2, 0, datetime(2018, 1, 1, 12, 9, 0)],
+            ],
+            columns=["id", "x", "y", "t"],
+        )
+        collection = TrajectoryCollection(df, "id", t="t", x="x", y="y", crs=31256)
+        assert [traj.id for traj in collection] == ["a", "b"]
+        assert collection.get_trajectory("a").to_linestring().wkt == (
+            "LINESTRING (5 0, 5 3)"
+        )
+        assert collection.get_trajectory("b").to_linestring().wkt == (
+            "LINESTRING (0 0, 1 0, 2 0)"
+        )
+
     def test_get_trajectory(self):
         assert self.collection.get_trajectory(1).id == 1
         assert self.collection.get_trajectory(1).obj_id == "A"
@@ -126,6 +147,19 @@ class TestTrajectoryCollection:
         assert isinstance(locs, GeoDataFrame)
         assert locs.crs == CRS_METRIC
 
+    def test_get_start_locations_with_differing_columns(self):
+        collection = self.collection.copy()
+        collection.trajectories[1].df["extra"] = 1
+        locs = collection.get_start_locations()
+        assert len(locs) == 2
+        assert pd.isna(locs.iloc[0].extra)
+        assert locs.iloc[1].extra == 1
+        assert locs.crs == CRS_METRIC
+
+    def test_get_start_locations_does_not_alter_trajectories(self):
+        self.collection.get_start_locations(with_direction=True)
+        assert DIRECTION_COL_NAME not in self.collection.get_column_names()
+
     def test_timestamp_column_present_in_start_locations(self):
         locs = self.collection.get_start_locations()
         assert "t" in locs.columns
@@ -168,6 +202,13 @@ class TestTrajectoryCollection:
         assert len(collection) == 1
         assert collection.trajectories[0] == self.collection.trajectories[0]
 
+    def test_get_intersecting_inside_bbox_only(self):
+        # inside the bounding box of trajectory 1 but off its path
+        polygon = Polygon([(1, 2), (1, 3), (2, 3), (2, 2), (1, 2)])
+        candidates = self.collection._get_bbox_candidates(polygon)
+        assert [traj.id for traj in candidates] == [1]
+        assert len(self.collection.get_intersecting(polygon)) == 0
+
     def test_intersection(self):
         feature = {
             "geometry": {
@@ -119,6 +119,25 @@ class TestTrajectoryGeneralizer:
         result = MinDistanceGeneralizer(traj).generalize(tolerance=1)
         assert result == make_traj([nodes[0], nodes[3], nodes[4]], CRS_METRIC)
 
+    def test_min_distance_latlon(self):
+        # points along a meridian, 0.001° (about 111 m) apart
+        nodes = [Node(10, i * 0.001, minute=i) for i in range(12)]
+        traj = make_traj(nodes, CRS_LATLON)
+        result = MinDistanceGeneralizer(traj).generalize(tolerance=300)
+        expected = [nodes[0], nodes[3], nodes[6], nodes[9], nodes[11]]
+        assert result == make_traj(expected, CRS_LATLON)
+
+    def test_min_distance_matches_pairwise_distances(self):
+        nodes = [Node(i % 3, i * 0.4, minute=i) for i in range(20)]
+        traj = make_traj(nodes, CRS_METRIC)
+        result = MinDistanceGeneralizer(traj).generalize(tolerance=1.2)
+        keep = [0]
+        for i, node in enumerate(nodes):
+            if node.geometry.distance(nodes[keep[-1]].geometry) >= 1.2:
+                keep.append(i)
+        keep.append(len(nodes) - 1)
+        assert result == make_traj([nodes[i] for i in keep], CRS_METRIC)
+
     def test_collection(self):
         collection = MinTimeDeltaGeneralizer(self.collection).generalize(
             tolerance=timedelta(minutes=10)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
+import pytest
 import pandas as pd
 from datetime import datetime
 from pyproj import CRS
@@ -11,7 +12,7 @@ from shapely.wkt import loads
 from movingpandas.trajectory_collection import TrajectoryCollection
 
 from .test_trajectory import make_traj, Node
-from . import requires_stonesoup
+from . import has_stonesoup, requires_stonesoup
 
 CRS_METRIC = CRS.from_user_input(31256)
 CRS_LATLON = CRS.from_user_input(4326)
@@ -138,3 +139,17 @@ class TestTrajectorySmoother:
         assert len(collection) == 2
         assert np.allclose(collection.trajectories[0].to_linestring().xy, truth_1.xy)
         assert np.allclose(collection.trajectories[1].to_linestring().xy, truth_2.xy)
+
+    @requires_stonesoup
+    def test_kalman_smoother_cv_package_attribute(self):
+        import movingpandas as mpd
+        from movingpandas.trajectory_smoother import KalmanSmootherCV
+
+        assert mpd.KalmanSmootherCV is KalmanSmootherCV
+
+    @pytest.mark.skipif(has_stonesoup, reason="requires stonesoup to be missing")
+    def test_kalman_smoother_cv_package_attribute_without_stonesoup(self):
+        import movingpandas as mpd
+
+        with pytest.raises(ImportError):
+            mpd.KalmanSmootherCV
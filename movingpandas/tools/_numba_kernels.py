@@ -0,0 +1,62 @@
+"""
+Numba-compiled versions of the numeric kernels in geometry_utils.
+
+This module requires Numba and is only imported on first use, see
+geometry_utils._get_numba_kernels.
+"""
+
+from math import atan2, cos, degrees, radians, sin, sqrt
+
+import numpy as np
+from numba import njit
+
+from movingpandas.geometry_utils import R_EARTH
+
+
+@njit(cache=True, fastmath=True)
+def haversine(lon1, lat1, lon2, lat2):
+    lat1 = radians(lat1)
+    lat2 = radians(lat2)
+    sin_dlat = sin((lat2 - lat1) / 2)
+    sin_dlon = sin(radians(lon2 - lon1) / 2)
+    a = sin_dlat * sin_dlat + cos(lat1) * cos(lat2) * sin_dlon * sin_dlon
+    return R_EARTH * 2 * atan2(sqrt(a), sqrt(1 - a))
+
+
+# Not parallelized with prange: Numba's thread pool does not survive the
+# fork of the multiprocessing pools used for n_threads > 1.
+@njit(cache=True, fastmath=True)
+def haversine_segments(lon, lat):
+    out = np.empty(lon.shape[0] - 1)
+    # each vertex is shared by two segments, so convert it only once
+    lat0 = radians(lat[0])
+    cos_lat0 = cos(lat0)
+    for i in range(out.shape[0]):
+        lat1 = radians(lat[i + 1])
+        cos_lat1 = cos(lat1)
+        sin_dlat = sin((lat1 - lat0) / 2)
+        sin_dlon = sin(radians(lon[i + 1] - lon[i]) / 2)
+        a = sin_dlat * sin_dlat + cos_lat0 * cos_lat1 * sin_dlon * sin_dlon
+        out[i] = R_EARTH * 2 * atan2(sqrt(a), sqrt(1 - a))
+        lat0 = lat1
+        cos_lat0 = cos_lat1
+    return out
+
+
+# No fastmath here: the bearings are results, not bounds, and have to match
+# geometry_utils._compass_bearing exactly.
+@njit(cache=True)
+def compass_bearing_segments(lon, lat):
+    out = np.empty(lon.shape[0] - 1)
+    for i in range(out.shape[0]):
+        lat1 = radians(lat[i])
+        lat2 = radians(lat[i + 1])
+        delta_lon = radians(lon[i + 1] - lon[i])
+        cos_lat2 = cos(lat2)
+        x = sin(delta_lon) * cos_lat2
+        y = cos(lat1) * sin(lat2) - (sin(lat1) * cos_lat2 * cos(delta_lon))
+        compass_bearing = degrees(atan2(x, y))
+        if compass_bearing < 0:
+            compass_bearing = (compass_bearing + 360) % 360
+        out[i] = compass_bearing
+    return out
@@ -69,6 +69,7 @@ def _get_deps_info():
         "hvplot",
         "mapclassify",
         "matplotlib",
+        "numba",
         "pandas",
         "pyproj",
         "shapely",
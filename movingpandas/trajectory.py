@@ -2,11 +2,12 @@
 
 import warnings
 
-from shapely.affinity import translate
+import numpy as np
+import shapely
 from shapely.geometry import Point, LineString
-from pandas import DataFrame, to_datetime, Series
+from pandas import DataFrame, Series, Timestamp, to_datetime
 from pandas.core.indexes.datetimes import DatetimeIndex
-from geopandas import GeoDataFrame
+from geopandas import GeoDataFrame, points_from_xy
 
 try:
     from pyproj import CRS
@@ -17,13 +18,19 @@ except ImportError:
 from .overlay import clip, intersection, intersects, create_entry_and_exit_points
 from .spatiotemporal_utils import STRange
 from .geometry_utils import (
-    angular_difference,
+    SHAPELY_GE_2,
+    angular_difference_array,
     azimuth,
+    azimuth_array,
     calculate_initial_compass_bearing,
-    measure_distance,
+    measure_distance_euclidean_array,
+    measure_distance_geodesic_array,
     measure_distance_line,
     measure_length,
     point_gdf_to_linestring,
+    _compass_bearing_segments,
+    _measure_distance,
+    _translate_point,
 )
 from .unit_utils import (
     UNITS,
@@ -48,6 +55,30 @@ TIMEDELTA_COL_NAME = "timedelta"
 TRAJ_ID_COL_NAME = "traj_id"
 
 
+def _get_sorted_index_position(index, t, method):
+    """
+    Equivalent of index.get_indexer([t], method=method)[0] for a sorted and
+    unique index, using binary search on the timestamps. As with get_indexer,
+    -1 marks a missing match.
+    """
+    if method in ("pad", "ffill"):
+        return index.searchsorted(t, side="right") - 1
+    if method in ("backfill", "bfill"):
+        pos = index.searchsorted(t, side="left")
+        return pos if pos < len(index) else -1
+    if method == "nearest":
+        t = Timestamp(t)
+        left = _get_sorted_index_position(index, t, "ffill")
+        right = _get_sorted_index_position(index, t, "bfill")
+        if left == -1:
+            return right
+        # ties go to the later row, as in get_indexer
+        if right == -1 or abs(index[left] - t) < abs(index[right] - t):
+            return left
+        return right
+    return index.get_indexer([t], method=method)[0]
+
+
 class TimeZoneWarning(UserWarning, ValueError):
     pass
 
@@ -120,7 +151,7 @@ class Trajectory:
             df = GeoDataFrame(
                 df.drop([x, y], axis=1),
                 crs=crs,
-                geometry=[Point(xy) for xy in zip(df[x], df[y])],
+                geometry=points_from_xy(df[x], df[y]),
             )
         if not isinstance(df.index, DatetimeIndex):
             if t is None:
@@ -148,7 +179,10 @@ class Trajectory:
         self.id = traj_id
         self.obj_id = obj_id
         df.sort_index(inplace=True)
-        self.df = df[~df.index.duplicated(keep="first")].copy()
+        if df.index.is_unique:
+            self.df = df.copy()
+        else:
+            self.df = df[~df.index.duplicated(keep="first")].copy()
         self.crs = df.crs
         self.parent = parent
 
@@ -157,7 +191,6 @@ class Trajectory:
         else:
             self.traj_id_col_name = TRAJ_ID_COL_NAME
         self.df[self.traj_id_col_name] = traj_id
-        self.df[self.traj_id_col_name].astype("category")
 
         if self.crs is not None:
             self.crs_units = self.crs.axis_info[0].unit_name
@@ -374,7 +407,7 @@ class Trajectory:
         >>> reprojected = trajectory.to_crs(CRS(4088))
         """
         temp = self.copy()
-        if type(crs) != CRS:
+        if not isinstance(crs, CRS):
             crs = CRS(crs)
         temp.crs = crs
         temp.df = temp.df.to_crs(crs)
@@ -618,7 +651,7 @@ class Trajectory:
             properties["wkt"] = self.to_linestringm_wkt()
         if agg:
             for col, agg_modes in agg.items():
-                if type(agg_modes) != list:
+                if not isinstance(agg_modes, list):
                     agg_modes = [agg_modes]
                 for agg_mode in agg_modes:
                     if agg_mode == "mode":
@@ -742,8 +775,12 @@ class Trajectory:
         try:
             return self.df.loc[t]
         except KeyError:
-            index = self.df.index.sort_values().drop_duplicates()
-            idx = index.get_indexer([t], method=method)[0]
+            index = self.df.index
+            if index.is_monotonic_increasing and index.is_unique:
+                idx = _get_sorted_index_position(index, t, method)
+            else:
+                index = index.sort_values().drop_duplicates()
+                idx = index.get_indexer([t], method=method)[0]
             return self.df.iloc[idx]
 
     def interpolate_position_at(self, t):
@@ -760,18 +797,24 @@ class Trajectory:
         shapely Point
             Interpolated position along the trajectory at time t
         """
-        prev_row = self.get_row_at(t, "ffill")
-        next_row = self.get_row_at(t, "bfill")
-        t_diff = next_row.name - prev_row.name
-        t_diff_at = t - prev_row.name
-        line = LineString(
-            [
-                prev_row[self.get_geom_col()],
-                next_row[self.get_geom_col()],
-            ]
-        )
+        index = self.df.index
+        if index.is_monotonic_increasing and index.is_unique:
+            # locate the neighbouring rows without materializing them
+            prev_pos = _get_sorted_index_position(index, t, "ffill")
+            next_pos = _get_sorted_index_position(index, t, "bfill")
+            geometries = self.df[self.get_geom_col()].values
+            prev_t, prev_pt = index[prev_pos], geometries[prev_pos]
+            next_t, next_pt = index[next_pos], geometries[next_pos]
+        else:
+            prev_row = self.get_row_at(t, "ffill")
+            next_row = self.get_row_at(t, "bfill")
+            prev_t, prev_pt = prev_row.name, prev_row[self.get_geom_col()]
+            next_t, next_pt = next_row.name, next_row[self.get_geom_col()]
+        t_diff = next_t - prev_t
+        t_diff_at = t - prev_t
+        line = LineString([prev_pt, next_pt])
         if t_diff == 0 or line.length == 0:
-            return prev_row[self.get_geom_col()]
+            return prev_pt
         interpolated_position = line.interpolate(t_diff_at / t_diff * line.length)
         return interpolated_position
 
@@ -904,7 +947,31 @@ class Trajectory:
             raise ValueError(f"Invalid trajectory! Got {pt1} instead of point!")
         if pt0 == pt1:
             return 0.0
-        return measure_distance(pt0, pt1, self.is_latlon, conversion)
+        d = _measure_distance(pt0, pt1, self.is_latlon)
+        return d * conversion.crs / conversion.distance
+
+    def _has_only_points(self):
+        geometry = self.df.geometry
+        return bool(((geometry.geom_type == "Point") & ~geometry.is_empty).all())
+
+    def _get_xy(self):
+        """
+        Return the trajectory's x and y coordinates as float arrays.
+        """
+        geometry = self.df.geometry
+        return geometry.x.to_numpy(dtype=float), geometry.y.to_numpy(dtype=float)
+
+    def _get_point_distances(self, conversion):
+        """
+        Return the distances between consecutive points, computed like
+        measure_distance but for all pairs at once.
+        """
+        x, y = self._get_xy()
+        if self.is_latlon:
+            d = measure_distance_geodesic_array(x[:-1], y[:-1], x[1:], y[1:])
+        else:
+            d = measure_distance_euclidean_array(x[:-1], y[:-1], x[1:], y[1:])
+        return d * conversion.crs / conversion.distance
 
     def _add_prev_pt(self, force=True):
         """
@@ -992,14 +1059,6 @@ class Trajectory:
         else:
             return azimuth(pt0, pt1)
 
-    def _compute_angular_difference(self, row):
-        degrees1 = row["prev_direction"]
-        degrees2 = row["direction"]
-        if degrees1 == degrees2:
-            return 0.0
-        else:
-            return angular_difference(degrees1, degrees2)
-
     def _compute_speed(self, row, conversion):
         pt0 = row["prev_pt"]
         pt1 = row[self.get_geom_col()]
@@ -1020,9 +1079,25 @@ class Trajectory:
             raise ValueError(f"Invalid trajectory! Got {pt1} instead of point!")
         if pt0 == pt1:
             # to avoid intersection issues with zero length lines
-            pt1 = translate(pt1, 0.00000001, 0.00000001)
+            pt1 = _translate_point(pt1, 0.00000001, 0.00000001)
         return LineString(list(pt0.coords) + list(pt1.coords))
 
+    def _get_segment_lines(self):
+        """
+        Vectorized equivalent of _connect_prev_pt_and_geometry for all rows
+        (requires Shapely 2 and a trajectory made up of 2D points only).
+        """
+        x, y = self._get_xy()
+        x1, y1 = x[1:], y[1:]
+        same = (x[:-1] == x1) & (y[:-1] == y1)
+        # to avoid intersection issues with zero length lines
+        x1 = np.where(same, x1 + 0.00000001, x1)
+        y1 = np.where(same, y1 + 0.00000001, y1)
+        coords = np.stack([x[:-1], y[:-1], x1, y1], axis=1).reshape(-1, 2, 2)
+        lines = np.empty(len(x), dtype=object)
+        lines[1:] = shapely.linestrings(coords)
+        return lines
+
     def add_traj_id(self, overwrite=False):
         """
         Add trajectory id column and values to the trajectory's DataFrame.
@@ -1062,12 +1137,20 @@ class Trajectory:
                 "Use overwrite=True to overwrite exiting values or update the "
                 "name arg."
             )
-        self._add_prev_pt()
-        self.df[name] = self.df.apply(self._compute_heading, axis=1)
+        if self._has_only_points():
+            x, y = self._get_xy()
+            if self.is_latlon:
+                directions = _compass_bearing_segments(x, y)
+            else:
+                directions = azimuth_array(x, y)
+            self.df[name] = np.concatenate([[0.0], directions])
+        else:
+            self._add_prev_pt()
+            self.df[name] = self.df.apply(self._compute_heading, axis=1)
+            self.df.drop(columns=["prev_pt"], inplace=True)
         # set the direction in the first row to the direction of the second row
         t0 = self.df.index.min().to_datetime64()
         self.df.at[t0, name] = self.df.iloc[1][name]
-        self.df.drop(columns=["prev_pt"], inplace=True)
         return self
 
     def add_angular_difference(
@@ -1094,14 +1177,14 @@ class Trajectory:
         direction_col = self.get_direction_col()
         if direction_col in self.df.columns:
             direction_exists = True
-            temp_df = self.df.copy()
         else:
             direction_exists = False
             self.add_direction(name=DIRECTION_COL_NAME)
-            temp_df = self.df.copy()
 
-        temp_df["prev_" + direction_col] = temp_df[direction_col].shift()
-        self.df[name] = temp_df.apply(self._compute_angular_difference, axis=1)
+        directions = self.df[direction_col].to_numpy(dtype=float)
+        self.df[name] = np.concatenate(
+            [[0.0], angular_difference_array(directions[:-1], directions[1:])]
+        )
         # set the first row to be 0
         t0 = self.df.index.min().to_datetime64()
         self.df.at[t0, name] = 0.0
@@ -1354,6 +1437,10 @@ class Trajectory:
 
     def _get_df_with_distance(self, conversion, name=DISTANCE_COL_NAME):
         temp_df = self.df.copy()
+        if self._has_only_points():
+            d = self._get_point_distances(conversion)
+            temp_df[name] = np.concatenate([[0.0], d])
+            return temp_df
         temp_df = temp_df.assign(prev_pt=temp_df.geometry.shift())
         try:
             temp_df[name] = temp_df.apply(
@@ -1369,6 +1456,18 @@ class Trajectory:
 
     def _get_df_with_speed(self, conversion, name=SPEED_COL_NAME):
         temp_df = self._get_df_with_timedelta(name="delta_t")
+        if self._has_only_points():
+            d = self._get_point_distances(conversion)
+            # Timedelta.total_seconds() as used by get_speed2 has microsecond
+            # resolution, so truncate the nanosecond deltas the same way
+            delta_t = temp_df["delta_t"].to_numpy()[1:].astype("timedelta64[us]")
+            seconds = delta_t.astype(np.int64) / 1e6
+            # rows less than a microsecond apart get a speed of zero
+            v = np.divide(d, seconds, out=np.zeros_like(d), where=seconds != 0)
+            v = v * conversion.time
+            # set the speed in the first row to the speed of the second row
+            temp_df[name] = np.concatenate([v[:1], v])
+            return temp_df.drop(columns=["delta_t"])
         temp_df = temp_df.assign(prev_pt=temp_df.geometry.shift())
         try:
             temp_df[name] = temp_df.apply(
@@ -1442,7 +1541,7 @@ class Trajectory:
                 f"the trajectory coordinate system is {self.crs}."
             )
             warnings.warn(message, UserWarning)
-        if type(other) == Trajectory:
+        if isinstance(other, Trajectory):
             other = other.to_linestring()
 
         conversion = get_conversion(units, self.crs_units)
@@ -1483,7 +1582,7 @@ class Trajectory:
                 f"the trajectory coordinate system is {self.crs}."
             )
             warnings.warn(message, UserWarning)
-        if type(other) == Trajectory:
+        if isinstance(other, Trajectory):
             other = other.to_linestring()
         dist = self.to_linestring().hausdorff_distance(other)
         conversion = get_conversion(units, self.crs_units)
@@ -1584,7 +1683,10 @@ class Trajectory:
         line_df["prev_pt"] = line_df.geometry.shift()
         line_df["t"] = self.df.index
         line_df["prev_t"] = line_df["t"].shift()
-        line_df["line"] = line_df.apply(self._connect_prev_pt_and_geometry, axis=1)
+        if SHAPELY_GE_2 and self._has_only_points() and not self.df.has_z.any():
+            line_df["line"] = self._get_segment_lines()
+        else:
+            line_df["line"] = line_df.apply(self._connect_prev_pt_and_geometry, axis=1)
         line_df = line_df.set_geometry("line")[1:]
         return line_df
 
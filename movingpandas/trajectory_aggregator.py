@@ -2,6 +2,8 @@
 
 from collections import Counter
 
+import numpy as np
+import shapely
 from pandas import DataFrame
 from geopandas import GeoDataFrame
 from shapely.geometry import LineString
@@ -9,9 +11,10 @@ from shapely.ops import nearest_points
 
 from movingpandas.point_clusterer import PointClusterer
 from .geometry_utils import (
+    SHAPELY_GE_2,
     azimuth,
     angular_difference,
-    measure_distance,
+    _measure_distance,
 )
 
 
@@ -220,7 +223,7 @@ class _PtsExtractor:
     def distance_greater_than(self, loc1, loc2, dist):
         pt1 = self.get_pt(loc1)
         pt2 = self.get_pt(loc2)
-        d = measure_distance(pt1, pt2, self.traj.is_latlon)
+        d = _measure_distance(pt1, pt2, self.traj.is_latlon)
         return d >= dist
 
     def get_pt(self, the_loc):
@@ -240,6 +243,7 @@ class _SequenceGenerator:
             self.cells_union = cells.geometry.union_all()
         except AttributeError:
             self.cells_union = cells.geometry.unary_union
+        self.cell_geoms = cells.geometry.to_numpy()
 
         self.id_to_centroid = {i: [f, [0, 0, 0, 0, 0]] for i, f in cells.iterrows()}
         self.sequences = Counter()
@@ -290,6 +294,12 @@ class _SequenceGenerator:
         return lines
 
     def get_nearest(self, pt):
+        if SHAPELY_GE_2:
+            dists = shapely.distance(self.cell_geoms, pt)
+            nearest = np.flatnonzero(dists == dists.min())
+            if len(nearest) == 1:
+                return self.cells.index[nearest[0]]
+            # equidistant cells: keep the tie-breaking of nearest_points below
         nearest = self.cells.geometry.geom_equals(
             nearest_points(pt, self.cells_union)[1]
         )
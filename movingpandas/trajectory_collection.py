@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from pandas import concat
+import numpy as np
+from pandas import DataFrame, concat
 from copy import copy
-from geopandas import GeoDataFrame
+from geopandas import GeoDataFrame, points_from_xy
 from .trajectory import (
     Trajectory,
     SPEED_COL_NAME,
@@ -14,7 +15,18 @@ from .trajectory import (
 )
 from .trajectory_plotter import _TrajectoryPlotter
 from .unit_utils import UNITS
-from .io import gdf_to_mf_json
+from .io import gdf_to_mf_json, _sort_by_traj_id
+from .overlay import _get_geometry_and_properties_from_feature
+
+
+def _split_by_id(df, traj_id_col):
+    """
+    Yields (traj_id, rows) pairs like df.groupby(traj_id_col) but slices one
+    sorted copy of the DataFrame instead of using the groupby iterator.
+    """
+    traj_ids, df, starts, ends = _sort_by_traj_id(df, traj_id_col)
+    for traj_id, start, end in zip(traj_ids, starts, ends):
+        yield traj_id, df.iloc[start:end].copy()
 
 
 @staticmethod
@@ -22,6 +34,19 @@ def traj_to_tc(traj):
     return TrajectoryCollection([traj])
 
 
+def _get_row_with_direction(traj, t, name):
+    """
+    Return the row of traj at t with a direction column, computed only for
+    the segment that determines the direction of that row.
+    """
+    pos = traj.df.index.get_loc(traj.get_row_at(t).name)
+    # the first row takes the direction of the second row
+    tmp = copy(traj)
+    tmp.df = traj.df.iloc[max(pos - 1, 0) : max(pos, 1) + 1].copy()
+    tmp.add_direction(name=name)
+    return tmp.get_row_at(t)
+
+
 class TrajectoryCollection:
     def __init__(
         self,
@@ -75,7 +100,7 @@ class TrajectoryCollection:
         self.min_length = min_length
         self.min_duration = min_duration
         self.t = t
-        if type(data) == list:
+        if isinstance(data, list):
             self.trajectories = [
                 traj for traj in data if traj.get_length() >= min_length
             ]
@@ -206,7 +231,15 @@ class TrajectoryCollection:
 
     def _df_to_trajectories(self, df, traj_id_col, obj_id_col, t, x, y, crs):
         trajectories = []
-        for traj_id, values in df.groupby(traj_id_col):
+        points = df
+        if not isinstance(df, GeoDataFrame) and x is not None and y is not None:
+            # build the point geometries once instead of once per trajectory
+            points = GeoDataFrame(
+                df.drop([x, y], axis=1),
+                crs=crs,
+                geometry=points_from_xy(df[x], df[y]),
+            )
+        for traj_id, values in _split_by_id(points, traj_id_col):
             if len(values) < 2:
                 continue
             if obj_id_col in values.columns:
@@ -356,30 +389,30 @@ class TrajectoryCollection:
             direction_col = self.get_direction_col()
             direction_missing = direction_col not in self.get_column_names()
 
+        add_direction = with_direction and direction_missing
         for traj in self:
             if t == "start":
-                tmp = traj.copy()
-                if with_direction and direction_missing:
-                    tmp.df = tmp.df.head(2)
-                    tmp.add_direction(name=direction_col)
-                x = tmp.get_row_at(tmp.get_start_time())
+                t_row = traj.get_start_time()
             elif t == "end":
-                tmp = traj.copy()
-                if with_direction and direction_missing:
-                    tmp.df = tmp.df.tail(2)
-                    tmp.add_direction(name=direction_col)
-                x = tmp.get_row_at(tmp.get_end_time())
+                t_row = traj.get_end_time()
             else:
                 if t < traj.get_start_time() or t > traj.get_end_time():
                     continue
-                tmp = traj.copy()
-                if with_direction and direction_missing:
-                    tmp.add_direction(name=direction_col)
-                x = tmp.get_row_at(t)
-            result.append(x.to_frame().T)
+                t_row = t
+            if add_direction:
+                x = _get_row_with_direction(traj, t_row, direction_col)
+            else:
+                x = traj.get_row_at(t_row)
+            result.append(x)
 
         if result:
-            df = concat(result)
+            columns = result[0].index
+            if all(x.index.equals(columns) for x in result):
+                # build the frame in one go, keeping the object dtype that
+                # concatenating transposed rows would produce
+                df = DataFrame(result, dtype=object)
+            else:
+                df = concat([x.to_frame().T for x in result])
             # Move temporal index to column t
             t = self.t or "t"
             df.reset_index(inplace=True)
@@ -442,6 +475,24 @@ class TrajectoryCollection:
         result.trajectories = segments
         return result
 
+    def _get_bbox_candidates(self, geometry):
+        """
+        Return the trajectories whose bounding boxes overlap the geometry's
+        bounding box.
+        """
+        trajectories = list(self)
+        if len(trajectories) == 0:
+            return trajectories
+        bounds = np.array([traj.get_bbox() for traj in trajectories])
+        minx, miny, maxx, maxy = geometry.bounds
+        overlap = (
+            (bounds[:, 2] >= minx)
+            & (bounds[:, 0] <= maxx)
+            & (bounds[:, 3] >= miny)
+            & (bounds[:, 1] <= maxy)
+        )
+        return [traj for traj, keep in zip(trajectories, overlap) if keep]
+
     def get_intersecting(self, polygon):
         """
         Return trajectories that intersect the given polygon.
@@ -456,7 +507,7 @@ class TrajectoryCollection:
             Resulting intersecting trajectories
         """
         intersecting = []
-        for traj in self:
+        for traj in self._get_bbox_candidates(polygon):
             try:
                 if traj.intersects(polygon):
                     intersecting.append(traj)
@@ -488,8 +539,13 @@ class TrajectoryCollection:
         TrajectoryCollection
             Intersecting trajectory segments
         """
+        try:
+            geometry, _ = _get_geometry_and_properties_from_feature(feature)
+            candidates = self._get_bbox_candidates(geometry)
+        except TypeError:
+            candidates = self
         intersections = []
-        for traj in self:
+        for traj in candidates:
             try:
                 for intersect in traj.intersection(feature, point_based):
                     if (
@@ -519,7 +575,7 @@ class TrajectoryCollection:
             Resulting clipped trajectory segments
         """
         clipped = []
-        for traj in self:
+        for traj in self._get_bbox_candidates(polygon):
             try:
                 for intersect in traj.clip(polygon, point_based):
                     if (
@@ -558,7 +614,7 @@ class TrajectoryCollection:
         """
         filtered = []
         for traj in self:
-            if type(property_values) == list:
+            if isinstance(property_values, list):
                 if traj.df.iloc[0][property_name] in property_values:
                     filtered.append(traj)
             else:
@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
 
 from copy import copy
-from shapely.geometry import LineString, Point
+from shapely.geometry import LineString
+import numpy as np
 import pandas as pd
 
 from .trajectory import Trajectory
 from .trajectory_collection import TrajectoryCollection
-from .geometry_utils import measure_distance
+from .geometry_utils import (
+    SPHERICAL_REL_ERROR,
+    measure_distance_euclidean_array,
+    _measure_distance,
+    _spherical_segment_lengths,
+)
 
 
 class TrajectoryGeneralizer:
@@ -78,20 +84,40 @@ class MinDistanceGeneralizer(TrajectoryGeneralizer):
     """
 
     def _generalize_traj(self, traj, tolerance):
-        temp_df = traj.df.copy()
-        prev_pt = temp_df.iloc[0][traj.get_geom_col()]
+        pts = traj.df[traj.get_geom_col()]
+        segment_lengths = self._get_segment_length_bounds(traj)
+        prev_pt = pts.iloc[0]
+        path_length = 0.0
         keep_rows = [0]
-        for i, pt in enumerate(temp_df[traj.get_geom_col()]):
-            dist = measure_distance(pt, prev_pt, traj.is_latlon)
+        for i, pt in enumerate(pts):
+            if i > 0:
+                path_length += segment_lengths[i - 1]
+            # the distance to prev_pt cannot exceed the path length travelled
+            # since prev_pt, so the exact distance is only computed if needed
+            if path_length < tolerance:
+                continue
+            dist = _measure_distance(pt, prev_pt, traj.is_latlon)
             if dist >= tolerance:
                 keep_rows.append(i)
                 prev_pt = pt
+                path_length = 0.0
 
         keep_rows.append(len(traj.df) - 1)
         new_df = traj.df.iloc[keep_rows]
         new_traj = Trajectory(new_df, traj.id, traj_id_col=traj.get_traj_id_col())
         return new_traj
 
+    @staticmethod
+    def _get_segment_length_bounds(traj):
+        """
+        Return upper bounds for the lengths of the trajectory's segments.
+        """
+        x = traj.df.geometry.x.to_numpy()
+        y = traj.df.geometry.y.to_numpy()
+        if traj.is_latlon:
+            return _spherical_segment_lengths(x, y) * (1 + SPHERICAL_REL_ERROR)
+        return np.hypot(np.diff(x), np.diff(y)) * (1 + 1e-9)
+
 
 class MinTimeDeltaGeneralizer(TrajectoryGeneralizer):
     """
@@ -248,10 +274,7 @@ class TopDownTimeRatioGeneralizer(TrajectoryGeneralizer):
             dx = ptn.x - pt0.x
             dy = ptn.y - pt0.y
 
-            dists = df.apply(
-                lambda rec: self._dist_from_calced(rec, t0, pt0, de, dx, dy),
-                axis=1,
-            )
+            dists = self._dists_from_calced(df, t0, pt0, de, dx, dy)
 
             if dists.max() > tolerance:
                 return pd.concat(
@@ -267,7 +290,14 @@ class TopDownTimeRatioGeneralizer(TrajectoryGeneralizer):
             else:
                 return df.iloc[[0, -1]]
 
-    def _dist_from_calced(self, rec, start_t, start_geom, de, dx, dy):
-        di = (rec.name - start_t).total_seconds()
-        calced = Point(start_geom.x + dx * di / de, start_geom.y + dy * di / de)
-        return rec[self.traj_col_name].distance(calced)
+    def _dists_from_calced(self, df, start_t, start_geom, de, dx, dy):
+        # seconds since start_t with the microsecond resolution of total_seconds()
+        di = (df.index - start_t).to_numpy().astype("timedelta64[us]")
+        di = di.astype(np.int64) / 1e6
+        calced_x = start_geom.x + dx * di / de
+        calced_y = start_geom.y + dy * di / de
+        geoms = df[self.traj_col_name]
+        dists = measure_distance_euclidean_array(
+            geoms.x.to_numpy(), geoms.y.to_numpy(), calced_x, calced_y
+        )
+        return pd.Series(dists, index=df.index)
@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import matplotlib.pyplot as plt
-
 
 class _TrajectoryPlotter:
     def __init__(self, data, *args, **kwargs):
@@ -54,6 +52,8 @@ class _TrajectoryPlotter:
 
     def plot(self):
         if not self.ax:
+            import matplotlib.pyplot as plt
+
             self.ax = plt.figure(figsize=self.figsize).add_subplot(1, 1, 1)
         tc = self.preprocess_data()
         line_plot = self._plot_lines(tc)
@@ -121,8 +121,8 @@ class ObservationGapSplitter(TrajectorySplitter):
         temp_df = traj.df.copy()
         temp_df["t"] = temp_df.index
         temp_df["gap"] = temp_df["t"].diff() > gap
-        temp_df["gap"] = temp_df["gap"].apply(lambda x: 1 if x else 0).cumsum()
-        dfs = [group[1] for group in temp_df.groupby(temp_df["gap"])]
+        temp_df["gap"] = temp_df["gap"].astype("int64").cumsum()
+        dfs = [group[1] for group in temp_df.groupby(temp_df["gap"], sort=False)]
         for i, df in enumerate(dfs):
             df = df.drop(columns=["t", "gap"])
             if len(df) > 1:
@@ -247,20 +247,21 @@ class AngleChangeSplitter(TrajectorySplitter):
             traj.add_speed(overwrite=True)
 
         comp_dir = traj.df[direction_col_name].iloc[0]
-        traj.df["dirChange"] = -1
         dir_group = 0
+        dir_groups = []
 
-        for i, (direction, speed) in enumerate(
-            zip(traj.df[direction_col_name].tolist(), traj.df[speed_col_name].tolist())
+        for direction, speed in zip(
+            traj.df[direction_col_name].tolist(), traj.df[speed_col_name].tolist()
         ):
             if speed >= min_speed:
                 if angular_difference(comp_dir, direction) >= min_angle:
                     comp_dir = direction
                     dir_group += 1
+            dir_groups.append(dir_group)
 
-            traj.df.iloc[i, traj.df.columns.get_loc("dirChange")] = dir_group
+        traj.df["dirChange"] = dir_groups
 
-        dfs = [group[1] for group in traj.df.groupby(traj.df["dirChange"])]
+        dfs = [group[1] for group in traj.df.groupby(traj.df["dirChange"], sort=False)]
         for i, df in enumerate(dfs):
             df = df.drop(columns=["dirChange"])
             if len(df) > 1:
@@ -302,8 +303,8 @@ class ValueChangeSplitter(TrajectorySplitter):
         temp_df = traj.df.copy()
         temp_df["t"] = temp_df.index
         temp_df["gap"] = temp_df[col_name].shift() != temp_df[col_name]
-        temp_df["gap"] = temp_df["gap"].apply(lambda x: 1 if x else 0).cumsum()
-        dfs = [group[1] for group in temp_df.groupby(temp_df["gap"])]
+        temp_df["gap"] = temp_df["gap"].astype("int64").cumsum()
+        dfs = [group[1] for group in temp_df.groupby(temp_df["gap"], sort=False)]
         for i, df in enumerate(dfs):
             df = df.drop(columns=["t", "gap"])
             if len(df) > 1:
@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
 
-from geopy import distance
 from math import hypot
 from multiprocessing import Pool
 from itertools import repeat
+import numpy as np
+import shapely
 from geopandas import GeoDataFrame
 from shapely.geometry import MultiPoint, Point
 from .trajectory import Trajectory
 from .trajectory_collection import TrajectoryCollection
-from .geometry_utils import mrr_diagonal
+from .geometry_utils import (
+    SHAPELY_GE_2,
+    SPHERICAL_REL_ERROR,
+    mrr_diagonal,
+    _get_spherical_distance_function,
+)
 from .trajectory_utils import convert_time_ranges_to_segments
 from .spatiotemporal_utils import TRangeWithTrajId
 
@@ -92,6 +98,7 @@ class TrajectoryStopDetector:
         geom = MultiPoint()
         is_stopped = False
         previously_stopped = False
+        spherical_distance = _get_spherical_distance_function()
 
         for t, pt in traj.df[traj.get_geom_col()].items():
             pts.append(pt)
@@ -119,11 +126,19 @@ class TrajectoryStopDetector:
             is_stopped = False
             if len(pts) > 1:
                 if traj.is_latlon:
-                    d = distance.distance((miny, minx), (maxy, maxx)).meters
+                    # lower bound of the geodesic distance, only used to
+                    # decide whether the exact check below is necessary
+                    d = spherical_distance(minx, miny, maxx, maxy)
+                    d *= 1 - SPHERICAL_REL_ERROR
                 else:
                     d = hypot(maxx - minx, maxy - miny)
                 if d < max_diameter * 1.5:
-                    geom = MultiPoint(pts)
+                    if SHAPELY_GE_2:
+                        # build the geometry from the coordinates in one call
+                        # instead of unwrapping the Points one by one
+                        geom = shapely.multipoints(np.column_stack([xs, ys]))
+                    else:
+                        geom = MultiPoint(pts)
                     if mrr_diagonal(geom, traj.is_latlon) < max_diameter:
                         is_stopped = True
 
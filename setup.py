@@ -37,6 +37,7 @@ setuptools.setup(
     install_requires=INSTALL_REQUIRES,
     extras_require={
         "smoothing": ["stonesoup"],
+        "speedups": ["numba"],
         "viz": ["hvplot", "bokeh", "cartopy", "geoviews"],
     },
 )